@@ -138,12 +138,10 @@ class GPUHandler:
 
                 vendor = "NVIDIA"
                 vram_str = format_bytes(mem.total)
-                try: device_id = nvidia_smi.nvmlDeviceGetPciInfo(handle).pciDeviceId
-                except Exception: device_id = "N/A"
-                try: vendor_id = nvidia_smi.nvmlDeviceGetPciInfo(handle).pciVendorId
-                except Exception: vendor_id = "N/A"
-                try: bus = nvidia_smi.nvmlDeviceGetPciInfo(handle).busId
-                except Exception: bus = "N/A"
+                try:
+                    pci = nvidia_smi.nvmlDeviceGetPciInfo(handle)
+                    device_id, vendor_id, bus = pci.pciDeviceId, pci.pciVendorId, pci.busId
+                except Exception: device_id = vendor_id = bus = "N/A"
 
                 gpu_stats = {
                     "id": i, "model": model_name, "temperature": temp,
@@ -1,14 +1,18 @@
 import asyncio
 import logging
 import signal
-import sys
 import asyncio 
-import queue 
-from typing import Dict, Optional, List, TYPE_CHECKING 
+from typing import Callable, Dict, Optional, List, TYPE_CHECKING 
 from datetime import datetime, timezone 
 
+try:
+    from ..utils.logger import setup_logger
+except ImportError:
+    from utils.logger import setup_logger
+
 if TYPE_CHECKING:
     from .service import BaseService
+    from .stats import StatsPayload
 
 class BeatriceDaemon:
     def __init__(self):
@@ -17,33 +21,19 @@ class BeatriceDaemon:
         self.services: Dict[str, 'BaseService'] = {} 
         self._service_tasks: List[asyncio.Task] = [] 
         self.logger = self._setup_logging()
-        self.update_queue = queue.Queue() 
+        self.update_callback: Optional[Callable[['StatsPayload'], None]] = None # Called from the daemon thread with each stats payload
 
     def _setup_logging(self) -> logging.Logger:
-        logger = logging.getLogger("BeatriceDaemon")
-        # Prevent duplicate handlers if logger already exists
-        if logger.hasHandlers():
-             logger.handlers.clear()
-             
-        logger.setLevel(logging.INFO) 
-        
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger.propagate = False # Avoid propagating to root logger if setup elsewhere
-        
-        return logger
+        # Propagates to the root QueueHandler, so daemon records are written by the listener thread, not the backend loop
+        return setup_logger("BeatriceDaemon")
 
     def register_service(self, service: 'BaseService'):
         if service.name in self.services:
             self.logger.warning(f"Service '{service.name}' already registered. Skipping.")
             return
         self.services[service.name] = service
-        if hasattr(service, 'set_update_queue'):
-             service.set_update_queue(self.update_queue)
+        if hasattr(service, 'set_update_callback'):
+             service.set_update_callback(self.update_callback)
         self.logger.info(f"Service '{service.name}' registered.")
 
     async def _start_services(self):
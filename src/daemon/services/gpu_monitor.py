@@ -3,11 +3,18 @@ import logging
 import platform
 import subprocess
 import json
-import queue 
-from typing import Dict, List, Optional, Any
+import statistics
+import time
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone 
 import psutil
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # --- Platform Specific Imports ---
 IS_MACOS = platform.system() == "Darwin"
 IS_WINDOWS = platform.system() == "Windows"
@@ -46,27 +53,47 @@ elif IS_LINUX: # Check NVIDIA on Linux
         NVIDIA_AVAILABLE = False
 # No specific checks needed for macOS here as it uses different methods
 
+# nvmlValueType_t -> member of the nvmlValue_t union holding a nvmlDeviceGetSamples() sample
+NVML_SAMPLE_VALUE_FIELDS = {0: "dVal", 1: "uiVal", 2: "ulVal", 3: "ullVal"}
+
 try:
     from ..service import BaseService, ServiceHealth, ServiceState 
+    from ..stats import GpuStatic, GpuStats, StatsPayload
     from ...utils.helpers import format_bytes 
 except ImportError:
     from daemon.service import BaseService, ServiceHealth, ServiceState
+    from daemon.stats import GpuStatic, GpuStats, StatsPayload
     from utils.helpers import format_bytes
 
+# Startup probe for NVML call latency; a slow median points at persistence mode being disabled
+NVML_LATENCY_PROBE_CALLS = 10
+NVML_SLOW_CALL_MS = 50
+
+SYSTEM_STATS_STATIC = GpuStatic(model="System Stats") # macOS fallback when system_profiler yields nothing
+WMI_ONLY_STATIC = GpuStatic()
+
 class GPUMonitorService(BaseService):
     def __init__(
         self,
         name: str = "gpu_monitor",
         monitoring_interval: int = 5, 
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        enable_persistence_mode: bool = False
     ):
         super().__init__(name, logger)
         self.monitoring_interval = monitoring_interval
-        self._last_collection_time: Optional[datetime] = None
+        self.enable_persistence_mode = enable_persistence_mode
+        self._last_collection_mono: Optional[int] = None # time.monotonic_ns() of the last collection
+        self._last_collection_iso: Optional[str] = None
+        self._last_publish_key: Optional[tuple] = None # Volatile fields of the last published payload
         self._collection_lock = asyncio.Lock() 
-        self.update_queue: Optional[queue.Queue] = None 
+        self._collection_future: Optional[asyncio.Future] = None # In-flight _collect_gpu_list on the executor
+        self._stop_event = asyncio.Event() # Set by stop() to wake the monitoring loop immediately
+        self.update_callback: Optional[Callable[[StatsPayload], None]] = None 
         
         self.nvidia_initialized = False
+        self._nvidia_static: Dict[int, GpuStatic] = {} # GPU index -> identity fields, resolved on first sight
+        self._last_sample_ts: Dict[Tuple[int, int], int] = {} # (gpu index, sampling type) -> newest NVML sample timestamp seen
         self.wmi_connection = None
 
         if NVIDIA_AVAILABLE:
@@ -74,9 +101,9 @@ class GPUMonitorService(BaseService):
         if WMI_AVAILABLE:
              self._initialize_wmi()
 
-    def set_update_queue(self, queue: queue.Queue): 
-        self.update_queue = queue
-        self.logger.info("Update queue set for GPUMonitorService.")
+    def set_update_callback(self, callback: Callable[[StatsPayload], None]): 
+        self.update_callback = callback
+        self.logger.info("Update callback set for GPUMonitorService.")
 
     def _initialize_nvidia_smi(self):
         if not NVIDIA_AVAILABLE: return
@@ -84,6 +111,7 @@ class GPUMonitorService(BaseService):
             nvidia_smi.nvmlInit()
             self.nvidia_initialized = True
             self.logger.info("NVIDIA SMI initialized successfully by GPUMonitorService.")
+            self._check_nvml_latency()
         except Exception as e:
             self.nvidia_initialized = False
             if hasattr(e, 'value') and isinstance(e.value, str):
@@ -91,6 +119,53 @@ class GPUMonitorService(BaseService):
             else:
                  self.logger.error(f"GPUMonitorService failed to initialize NVIDIA SMI: {e}")
                  
+    def _check_nvml_latency(self):
+        """Warn when NVML calls are slow, which usually means persistence mode is off and the driver re-initializes per call."""
+        try:
+            if nvidia_smi.nvmlDeviceGetCount() == 0: return
+            handle = nvidia_smi.nvmlDeviceGetHandleByIndex(0)
+            timings = []
+            for _ in range(NVML_LATENCY_PROBE_CALLS):
+                t0 = time.perf_counter()
+                nvidia_smi.nvmlDeviceGetTemperature(handle, nvidia_smi.NVML_TEMPERATURE_GPU)
+                timings.append(time.perf_counter() - t0)
+        except Exception as e:
+            self.logger.debug("NVML latency probe failed: %s", e)
+            return
+
+        median_ms = statistics.median(timings) * 1000
+        self.logger.debug("NVML latency probe: median %.2f ms", median_ms)
+        if median_ms <= NVML_SLOW_CALL_MS: return
+
+        self.logger.warning(f"NVML persistence mode likely OFF (median call {median_ms:.0f} ms); monitoring latency will be high. Run 'nvidia-smi -pm 1'")
+        if self.enable_persistence_mode:
+            self._enable_persistence_mode()
+
+    def _enable_persistence_mode(self):
+        try:
+            for i in range(nvidia_smi.nvmlDeviceGetCount()):
+                handle = nvidia_smi.nvmlDeviceGetHandleByIndex(i)
+                if nvidia_smi.nvmlDeviceGetPersistenceMode(handle) != nvidia_smi.NVML_FEATURE_ENABLED:
+                    nvidia_smi.nvmlDeviceSetPersistenceMode(handle, nvidia_smi.NVML_FEATURE_ENABLED)
+                    self.logger.info(f"Enabled NVML persistence mode on GPU {i}.")
+        except nvidia_smi.NVMLError_NoPermission:
+            self.logger.warning("Enabling NVML persistence mode requires root; leaving it unchanged.")
+        except Exception as e:
+            self.logger.warning(f"Could not enable NVML persistence mode: {e}")
+
+    def _get_nvml_sample_stats(self, handle, gpu_idx: int, sampling_type: int) -> Optional[Tuple[float, float]]:
+        """Mean and max of the samples NVML buffered since the previous call, or None if there are none."""
+        key = (gpu_idx, sampling_type)
+        try:
+            value_type, samples = nvidia_smi.nvmlDeviceGetSamples(handle, sampling_type, self._last_sample_ts.get(key, 0))
+        except nvidia_smi.NVMLError:
+            return None # NotFound when nothing new was buffered, NotSupported on older boards
+        if not samples: return None
+        self._last_sample_ts[key] = max(s.timeStamp for s in samples)
+        field = NVML_SAMPLE_VALUE_FIELDS.get(value_type, "uiVal")
+        values = [getattr(s.sampleValue, field) for s in samples]
+        return sum(values) / len(values), max(values)
+
     def _initialize_wmi(self):
          if not WMI_AVAILABLE: return
          try:
@@ -118,14 +193,15 @@ class GPUMonitorService(BaseService):
             self.logger.error(f"Unexpected error running command '{' '.join(cmd_list)}': {e}")
             return None
 
-    def _get_macos_gpu_info(self) -> List[Dict[str, Any]]:
+    def _get_macos_gpu_info(self) -> List[GpuStats]:
         gpus = []
         try:
             cmd_list = ['system_profiler', 'SPDisplaysDataType', '-json']
             output = self._run_command(cmd_list)
             if not output: return [] 
 
-            data = json.loads(output)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the handler below covers both
+            data = orjson.loads(output) if ORJSON_AVAILABLE else json.loads(output)
             display_info = data.get('SPDisplaysDataType', [])
             if not display_info: return [] 
 
@@ -136,84 +212,97 @@ class GPUMonitorService(BaseService):
                 name = gpu_data.get("_name") if IS_MACOS else gpu_data.get("sppci_model") 
                 if not name: name = gpu_data.get("sppci_model", "Unknown GPU")
 
-                gpu_stats = {
-                    "id": idx, "model": name,
-                    "vendor": gpu_data.get("spdisplays_vendor", "Unknown").split('(')[0].strip(),
-                    "vram": gpu_data.get("spdisplays_vram", "N/A"),
-                    "device_id": gpu_data.get("spdisplays_device_id", gpu_data.get("sppci_device_id", "N/A")),
-                    "vendor_id": gpu_data.get("spdisplays_vendor_id", gpu_data.get("sppci_vendor_id", "N/A")),
-                    "bus": gpu_data.get("spdisplays_pcislot", gpu_data.get("sppci_bus", "N/A")),
-                    "metal_family": gpu_data.get("spdisplays_metal_family", "N/A"),
-                    "temperature": None, "utilization": cpu_percent, 
-                    "memory_used": mem_info.used, "memory_total": mem_info.total, 
-                    "power_usage": None, "fan_speed": None,
-                }
-                gpus.append(gpu_stats)
+                static = GpuStatic(
+                    model=name,
+                    vendor=gpu_data.get("spdisplays_vendor", "Unknown").split('(')[0].strip(),
+                    vram=gpu_data.get("spdisplays_vram", "N/A"),
+                    device_id=gpu_data.get("spdisplays_device_id", gpu_data.get("sppci_device_id", "N/A")),
+                    vendor_id=gpu_data.get("spdisplays_vendor_id", gpu_data.get("sppci_vendor_id", "N/A")),
+                    bus=gpu_data.get("spdisplays_pcislot", gpu_data.get("sppci_bus", "N/A")),
+                    metal_family=gpu_data.get("spdisplays_metal_family", "N/A"),
+                )
+                gpus.append(GpuStats(
+                    id=idx, static=static, utilization=cpu_percent,
+                    memory_used=mem_info.used, memory_total=mem_info.total,
+                ))
         except json.JSONDecodeError as e:
-             self.logger.error(f"Error parsing system_profiler JSON output: {e}")
+             self.logger.error("Error parsing system_profiler JSON output: %s", e)
         except Exception as e:
-            self.logger.error(f"Error getting macOS GPU/System info: {e}", exc_info=True)
+            self.logger.error("Error getting macOS GPU/System info: %s", e)
         
         if not gpus:
              try:
                   cpu_percent = psutil.cpu_percent(interval=None)
                   mem_info = psutil.virtual_memory()
-                  gpus.append({
-                      "id": 0, "model": "System Stats", "vendor": "N/A", "vram": "N/A", 
-                      "device_id": "N/A", "vendor_id": "N/A", "bus": "N/A", "metal_family": "N/A",
-                      "temperature": None, "utilization": cpu_percent, 
-                      "memory_used": mem_info.used, "memory_total": mem_info.total, 
-                      "power_usage": None, "fan_speed": None,
-                  })
+                  gpus.append(GpuStats(
+                      id=0, static=SYSTEM_STATS_STATIC, utilization=cpu_percent,
+                      memory_used=mem_info.used, memory_total=mem_info.total,
+                  ))
              except Exception as ps_e:
                   self.logger.error(f"Failed to get even basic system stats: {ps_e}")
 
         return gpus
 
-    def _get_nvidia_gpu_info(self) -> List[Dict[str, Any]]:
+    def _get_nvidia_gpu_info(self) -> List[GpuStats]:
         gpus = []
         if not self.nvidia_initialized: return gpus
         try:
             device_count = nvidia_smi.nvmlDeviceGetCount()
             for i in range(device_count):
                 handle = nvidia_smi.nvmlDeviceGetHandleByIndex(i)
-                model_name = nvidia_smi.nvmlDeviceGetName(handle)
                 temp = nvidia_smi.nvmlDeviceGetTemperature(handle, nvidia_smi.NVML_TEMPERATURE_GPU)
-                util = nvidia_smi.nvmlDeviceGetUtilizationRates(handle)
                 mem = nvidia_smi.nvmlDeviceGetMemoryInfo(handle)
-                power, fan = None, None
-                try: power = nvidia_smi.nvmlDeviceGetPowerUsage(handle) / 1000.0
-                except nvidia_smi.NVMLError_NotSupported: pass
-                except Exception as e_p: self.logger.debug(f"Power query failed GPU {i}: {e_p}")
+                static = self._nvidia_static.get(i)
+                if static is None:
+                    static = self._nvidia_static[i] = self._get_nvidia_static(handle, mem.total)
+                power, power_max, fan = None, None, None
+
+                # Average over everything the driver sampled since the last tick instead of a single instantaneous reading
+                util_samples = self._get_nvml_sample_stats(handle, i, nvidia_smi.NVML_GPU_UTILIZATION_SAMPLES)
+                if util_samples:
+                    util_avg, util_max = round(util_samples[0], 1), util_samples[1]
+                else:
+                    util_avg = util_max = nvidia_smi.nvmlDeviceGetUtilizationRates(handle).gpu
+
+                power_samples = self._get_nvml_sample_stats(handle, i, nvidia_smi.NVML_TOTAL_POWER_SAMPLES)
+                if power_samples:
+                    power, power_max = power_samples[0] / 1000.0, power_samples[1] / 1000.0
+                else:
+                    try: power = nvidia_smi.nvmlDeviceGetPowerUsage(handle) / 1000.0
+                    except nvidia_smi.NVMLError_NotSupported: pass
+                    except Exception as e_p: self.logger.debug("Power query failed GPU %s: %s", i, e_p)
+                    power_max = power
                 try: fan = nvidia_smi.nvmlDeviceGetFanSpeed(handle)
                 except nvidia_smi.NVMLError_NotSupported: pass
-                except Exception as e_f: self.logger.debug(f"Fan query failed GPU {i}: {e_f}")
-
-                vendor = "NVIDIA" 
-                vram_str = format_bytes(mem.total) 
-                try: device_id = nvidia_smi.nvmlDeviceGetPciInfo(handle).pciDeviceId
-                except Exception: device_id = "N/A"
-                try: vendor_id = nvidia_smi.nvmlDeviceGetPciInfo(handle).pciVendorId
-                except Exception: vendor_id = "N/A"
-                try: bus = nvidia_smi.nvmlDeviceGetPciInfo(handle).busId 
-                except Exception: bus = "N/A"
-                
-                gpu_stats = {
-                    "id": i, "model": model_name, "vendor": vendor, "vram": vram_str,
-                    "device_id": hex(device_id) if isinstance(device_id, int) else device_id, 
-                    "vendor_id": hex(vendor_id) if isinstance(vendor_id, int) else vendor_id, 
-                    "bus": bus, "metal_family": "N/A", 
-                    "temperature": temp, "utilization": util.gpu,
-                    "memory_used": mem.used, "memory_total": mem.total,
-                    "power_usage": power, "fan_speed": fan
-                }
-                gpus.append(gpu_stats)
+                except Exception as e_f: self.logger.debug("Fan query failed GPU %s: %s", i, e_f)
+
+                gpus.append(GpuStats(
+                    id=i, static=static, temperature=temp, utilization=util_avg,
+                    utilization_avg=util_avg, utilization_max=util_max,
+                    memory_used=mem.used, memory_total=mem.total,
+                    power_usage=power, power_max=power_max, fan_speed=fan,
+                ))
         except nvidia_smi.NVMLError as e:
-             self.logger.error(f"NVIDIA SMI error getting stats: {e}")
+             self.logger.error("NVIDIA SMI error getting stats: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error getting NVIDIA stats: {e}", exc_info=True)
+            self.logger.error("Unexpected error getting NVIDIA stats: %s", e)
         return gpus
         
+    def _get_nvidia_static(self, handle, mem_total: int) -> GpuStatic:
+        """Name, PCI ids and VRAM don't change after boot, so they are queried and formatted once per GPU."""
+        model_name = nvidia_smi.nvmlDeviceGetName(handle)
+        try:
+            pci = nvidia_smi.nvmlDeviceGetPciInfo(handle)
+            device_id, vendor_id, bus = pci.pciDeviceId, pci.pciVendorId, pci.busId
+        except Exception: device_id = vendor_id = bus = "N/A"
+
+        return GpuStatic(
+            model=model_name, vendor="NVIDIA", vram=format_bytes(mem_total),
+            device_id=hex(device_id) if isinstance(device_id, int) else device_id,
+            vendor_id=hex(vendor_id) if isinstance(vendor_id, int) else vendor_id,
+            bus=bus,
+        )
+
     def _get_windows_wmi_gpu_info(self) -> List[Dict[str, Any]]:
          """Get additional GPU info using WMI on Windows."""
          gpus_wmi = []
@@ -240,57 +329,68 @@ class GPUMonitorService(BaseService):
                    gpus_wmi.append(wmi_data)
                    
          except Exception as e:
-              self.logger.error(f"Error querying WMI for GPU info: {e}", exc_info=True)
+              self.logger.error("Error querying WMI for GPU info: %s", e)
               # Optionally disable WMI if queries consistently fail
               # self.wmi_connection = None 
               # WMI_AVAILABLE = False
          return gpus_wmi
 
+    def _collect_gpu_list(self) -> List[GpuStats]:
+        """Blocking collection (subprocess/NVML/WMI calls); run off the event loop via run_in_executor."""
+        gpu_list: List[GpuStats] = []
+        if IS_MACOS:
+            gpu_list = self._get_macos_gpu_info()
+        elif IS_WINDOWS:
+             if NVIDIA_AVAILABLE and self.nvidia_initialized:
+                  gpu_list = self._get_nvidia_gpu_info()
+             # Try to get WMI info and merge/add it
+             wmi_gpu_list = self._get_windows_wmi_gpu_info()
+             if wmi_gpu_list:
+                  if gpu_list: # Try to merge based on name/ID if NVML data exists
+                       for nvml_gpu in gpu_list:
+                            # Simple merge attempt by matching name (might be fragile)
+                            matching_wmi = next((wmi_gpu for wmi_gpu in wmi_gpu_list if wmi_gpu.get("wmi_name") and wmi_gpu["wmi_name"] in nvml_gpu.model), None)
+                            if matching_wmi:
+                                 nvml_gpu.wmi = matching_wmi # Add WMI fields to the NVML record
+                  else: # If only WMI data is available
+                       gpu_list = [GpuStats(id=wmi_gpu["id"], static=WMI_ONLY_STATIC, wmi=wmi_gpu) for wmi_gpu in wmi_gpu_list]
+        elif IS_LINUX and NVIDIA_AVAILABLE and self.nvidia_initialized:
+             gpu_list = self._get_nvidia_gpu_info()
+        else:
+            self.logger.warning("No compatible GPU monitoring available for stat collection.")
+            pass 
+        return gpu_list
+
     async def _collect_and_send_stats(self):
         async with self._collection_lock: 
-            stats_data = {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "active_gpus": 0,
-                "total_earnings": 0, 
-                "gpus": []
-            }
+            timestamp = datetime.now(timezone.utc).isoformat()
             
-            gpu_list = []
-            if IS_MACOS:
-                gpu_list = self._get_macos_gpu_info()
-            elif IS_WINDOWS:
-                 if NVIDIA_AVAILABLE and self.nvidia_initialized:
-                      gpu_list = self._get_nvidia_gpu_info()
-                 # Try to get WMI info and merge/add it
-                 wmi_gpu_list = self._get_windows_wmi_gpu_info()
-                 if wmi_gpu_list:
-                      if gpu_list: # Try to merge based on name/ID if NVML data exists
-                           for nvml_gpu in gpu_list:
-                                # Simple merge attempt by matching name (might be fragile)
-                                matching_wmi = next((wmi_gpu for wmi_gpu in wmi_gpu_list if wmi_gpu.get("wmi_name") and wmi_gpu["wmi_name"] in nvml_gpu.get("model", "")), None)
-                                if matching_wmi:
-                                     nvml_gpu.update(matching_wmi) # Add WMI fields to NVML dict
-                      else: # If only WMI data is available
-                           gpu_list = wmi_gpu_list 
-            elif IS_LINUX and NVIDIA_AVAILABLE and self.nvidia_initialized:
-                 gpu_list = self._get_nvidia_gpu_info()
-            else:
-                self.logger.warning("No compatible GPU monitoring available for stat collection.")
-                pass 
+            # Collectors block on system_profiler/NVML/WMI; keep the shared backend loop responsive meanwhile
+            # Shielded: cancelling this task can't stop the worker thread, so stop() waits on the future itself
+            self._collection_future = asyncio.get_running_loop().run_in_executor(None, self._collect_gpu_list)
+            gpu_list = await asyncio.shield(self._collection_future)
+
+            active_gpus = len(gpu_list) if any(g.static is not SYSTEM_STATS_STATIC for g in gpu_list) else 0
+            self._last_collection_mono = time.monotonic_ns()
+            self._last_collection_iso = timestamp
 
-            stats_data["gpus"] = gpu_list
-            stats_data["active_gpus"] = len(gpu_list) if any(g.get("model") != "System Stats" for g in gpu_list) else 0
-            self._last_collection_time = datetime.now(timezone.utc)
+            # Idle GPUs report the same readings tick after tick; don't make the GUI redraw for them
+            publish_key = tuple(
+                (g.id, g.utilization, g.memory_used, g.temperature, g.power_usage, g.fan_speed)
+                for g in gpu_list
+            )
+            if publish_key == self._last_publish_key:
+                return
+            self._last_publish_key = publish_key
+            stats_data = StatsPayload(timestamp=timestamp, active_gpus=active_gpus, gpus=gpu_list)
             
-            if self.update_queue:
+            if self.update_callback:
                 try:
-                    self.update_queue.put_nowait(stats_data) 
-                except queue.Full: 
-                     self.logger.warning("Update queue is full. Discarding latest stats.")
-                except Exception as qe:
-                     self.logger.error(f"Error putting stats into queue: {qe}")
+                    self.update_callback(stats_data) 
+                except Exception as ce:
+                     self.logger.error("Error delivering stats to update callback: %s", ce)
             else:
-                self.logger.warning("Update queue not set. Cannot send stats to GUI.")
+                self.logger.warning("Update callback not set. Cannot send stats to GUI.")
 
     async def start(self) -> bool:
         if self.state == ServiceState.RUNNING:
@@ -298,6 +398,7 @@ class GPUMonitorService(BaseService):
             return True
             
         await super().start() 
+        self._stop_event.clear()
         
         self.logger.info(f"Starting monitoring loop for {self.name}")
         self._start_time = datetime.now(timezone.utc) 
@@ -309,8 +410,7 @@ class GPUMonitorService(BaseService):
 
             while self._is_running: 
                 try:
-                    await asyncio.sleep(self.monitoring_interval)
-                    if not self._is_running: 
+                    if await self._wait_for_stop(self.monitoring_interval) or not self._is_running:
                         self.logger.info(f"Stop requested during sleep for {self.name}. Exiting loop.")
                         break 
                     await self._collect_and_send_stats()
@@ -318,9 +418,9 @@ class GPUMonitorService(BaseService):
                      self.logger.info(f"Monitoring loop cancelled for {self.name}.")
                      break 
                 except Exception as loop_e:
-                     self.logger.error(f"Error during monitoring interval for {self.name}: {loop_e}", exc_info=True)
+                     self.logger.error("Error during monitoring interval for %s: %s", self.name, loop_e)
                      if not self._is_running: break 
-                     await asyncio.sleep(self.monitoring_interval * 2) 
+                     if await self._wait_for_stop(self.monitoring_interval * 2): break
 
             self.logger.info(f"Service {self.name} monitoring loop finished.")
 
@@ -336,21 +436,36 @@ class GPUMonitorService(BaseService):
              await self.stop() 
 
 
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        """Sleep for up to `timeout` seconds; returns True as soon as stop() is requested."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     async def stop(self) -> bool:
         if self.state == ServiceState.STOPPED or self.state == ServiceState.STOPPING:
              return True 
 
+        self._stop_event.set()
         await super().stop() 
         
         self.logger.info(f"Performing cleanup for {self.name}")
         
-        if self.nvidia_initialized:
-            try:
-                nvidia_smi.nvmlShutdown()
-                self.nvidia_initialized = False
-                self.logger.info("NVIDIA SMI shutdown complete by GPUMonitorService.")
-            except Exception as e:
-                self.logger.error(f"Error during NVIDIA SMI shutdown in GPUMonitorService: {e}")
+        async with self._collection_lock:
+            # A cancelled collection releases the lock while its worker thread may still be inside NVML
+            if self._collection_future is not None and not self._collection_future.done():
+                await asyncio.wait((self._collection_future,))
+            if self.nvidia_initialized:
+                try:
+                    nvidia_smi.nvmlShutdown()
+                    self.nvidia_initialized = False
+                    self._nvidia_static.clear()
+                    self._last_sample_ts.clear()
+                    self.logger.info("NVIDIA SMI shutdown complete by GPUMonitorService.")
+                except Exception as e:
+                    self.logger.error(f"Error during NVIDIA SMI shutdown in GPUMonitorService: {e}")
                 
         # No specific cleanup needed for WMI connection object
         self.wmi_connection = None
@@ -366,8 +481,8 @@ class GPUMonitorService(BaseService):
         
         if not health.status:
             health.last_error = f"Service not in RUNNING state (current: {self.state})"
-        elif self._last_collection_time:
-            time_since_last = (datetime.now(timezone.utc) - self._last_collection_time).total_seconds()
+        elif self._last_collection_mono is not None:
+            time_since_last = (time.monotonic_ns() - self._last_collection_mono) / 1e9
             if time_since_last > self.monitoring_interval * 3: 
                 health.status = False
                 health.last_error = f"Data collection seems stalled (last update: {time_since_last:.1f}s ago)"
@@ -377,7 +492,7 @@ class GPUMonitorService(BaseService):
 
         health.metrics = {
             "state": self.state.value,
-            "last_collection": self._last_collection_time.isoformat() if self._last_collection_time else None,
+            "last_collection": self._last_collection_iso,
             "monitoring_interval": self.monitoring_interval,
             "nvidia_available": NVIDIA_AVAILABLE,
             "nvidia_initialized": self.nvidia_initialized,
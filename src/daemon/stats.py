@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any
+
+@dataclass(frozen=True, slots=True)
+class GpuStatic:
+    """Per-GPU fields that never change while the daemon runs; shared by every GpuStats sample."""
+    model: str = "N/A"
+    vendor: str = "N/A"
+    vram: str = "N/A"
+    device_id: str = "N/A"
+    vendor_id: str = "N/A"
+    bus: str = "N/A"
+    metal_family: str = "N/A"
+
+@dataclass(slots=True)
+class GpuStats:
+    id: int
+    static: GpuStatic
+    temperature: Optional[float] = None
+    utilization: Optional[float] = None
+    utilization_avg: Optional[float] = None
+    utilization_max: Optional[float] = None
+    memory_used: Optional[int] = None
+    memory_total: Optional[int] = None
+    power_usage: Optional[float] = None
+    power_max: Optional[float] = None
+    fan_speed: Optional[int] = None
+    wmi: Optional[Dict[str, Any]] = None # Extra wmi_* fields merged in on Windows
+
+    @property
+    def model(self) -> str:
+        return self.static.model
+
+@dataclass(slots=True)
+class StatsPayload:
+    """One monitoring tick as delivered to the GUI."""
+    timestamp: str
+    active_gpus: int = 0
+    total_earnings: float = 0.0
+    gpus: List[GpuStats] = field(default_factory=list)
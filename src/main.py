@@ -1,81 +1,132 @@
 import sys
 import logging
-import platform
 import asyncio
-import threading 
-import queue 
-import webbrowser
-import urllib.parse
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QPushButton # Added QPushButton back
+from typing import Final, NamedTuple, Optional
+from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu
 from PyQt6.QtGui import QIcon, QAction 
-from PyQt6.QtCore import QTimer, pyqtSignal, QObject 
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject, QResource 
 
 from ui.main_window import MainWindow
-from ui.settings_dialog import SettingsDialog 
-from ui.gpu_status_dialog import GPUStatusDialog 
 from daemon.core import BeatriceDaemon
-from daemon.services.gpu_monitor import GPUMonitorService
+from daemon.stats import StatsPayload
+from daemon.services.gpu_monitor import GPUMonitorService, IS_MACOS, NVIDIA_AVAILABLE
 from core.marketplace import MarketplaceConnector 
 from utils.config import ConfigManager
-from utils.logger import setup_logger
+from utils.logger import setup_logger, set_log_level, stop_log_listeners
 # Import web server functions
 from web.local_server import start_local_server, stop_local_server 
 
+try:
+    import uvloop # Faster drop-in event loop; not available on Windows
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+class GPUCaps(NamedTuple):
+    is_macos: bool
+    nvidia_available: bool
+
+# Platform/NVML detection already happened when gpu_monitor was imported; freeze it once here
+GPU_CAPS = GPUCaps(is_macos=IS_MACOS, nvidia_available=NVIDIA_AVAILABLE)
+_NVIDIA_MISSING_MESSAGE = "Info: NVIDIA library not found. GPU monitoring disabled." if not GPU_CAPS.is_macos and not GPU_CAPS.nvidia_available else None
+
+def _detect_browser_argv() -> Optional[list[str]]:
+    """Resolve the OS URL opener once so each click is a single Popen instead of webbrowser's registry scan."""
+    opener = "open" if GPU_CAPS.is_macos else "xdg-open"
+    path = shutil.which(opener)
+    return [path] if path else None # None (e.g. Windows) falls back to webbrowser.open
+
+_TRAY_ICON_PATH: Final = Path(__file__).resolve().parent / "icons" / "dante-logo.png" # Source file of the :/icons/tray_icon.png alias
+# Optional binary bundle compiled from resources.qrc (see README); PyQt6 ships no pyrcc, so the .rcc is mapped at runtime
+_RESOURCES_RCC: Final = Path(__file__).resolve().parent / "resources.rcc"
+_TRAY_ICON_RESOURCE: Final = ":/icons/tray_icon.png"
+
+BACKEND_WORKERS = 2 # Default executor for blocking work the backend loop offloads (the loop has its own thread)
+STATS_FLUSH_DELAY_MS = 16 # ~one frame at 60 Hz
+
+_STYLESHEET = """
+    QWidget { background-color: #2b2b2b; color: #f0f0f0; font-size: 11pt; }
+    QMainWindow { background-color: #3c3f41; }
+    QGroupBox { background-color: #3c3f41; border: 1px solid #555; border-radius: 5px; margin-top: 1ex; font-weight: bold; }
+    QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; padding: 0 3px; background-color: #555; color: #f0f0f0; border-radius: 3px; }
+    QLabel { background-color: transparent; }
+    QTableView { background-color: #3c3f41; border: 1px solid #555; gridline-color: #555; alternate-background-color: #45494c; }
+    QHeaderView::section { background-color: #555; color: #f0f0f0; padding: 4px; border: 1px solid #3c3f41; font-weight: bold; }
+    QTableView::item { padding: 5px; }
+    QProgressBar { border: 1px solid #555; border-radius: 5px; text-align: center; background-color: #45494c; color: #f0f0f0; }
+    QProgressBar::chunk { background-color: #007bff; width: 10px; margin: 0.5px; border-radius: 4px; }
+    QToolTip { background-color: #2b2b2b; color: #f0f0f0; border: 1px solid #555; }
+    QMenu { background-color: #3c3f41; border: 1px solid #555; }
+    QMenu::item { padding: 5px 20px; }
+    QMenu::item:selected { background-color: #007bff; }
+    QMenu::separator { height: 1px; background: #555; margin-left: 10px; margin-right: 5px; }
+    QPushButton { padding: 5px 10px; background-color: #007bff; color: white; border: none; border-radius: 3px; }
+    QPushButton:hover { background-color: #0056b3; }
+    QPushButton:disabled { background-color: #555; }
+"""
+
 class Communicate(QObject):
-    stats_update = pyqtSignal(dict) 
+    stats_update = pyqtSignal(object) # StatsPayload
     wallet_update = pyqtSignal(str) # Signal for wallet address updates
 
 class DanteGPU:
+    _tray_icon: Optional[QIcon] = None # Built once, after the QApplication exists
+
     def __init__(self):
         self.logger = setup_logger(__name__) 
         self.config = ConfigManager()
         
         log_level_str = self.config.get("log_level", "INFO").upper()
         log_level = getattr(logging, log_level_str, logging.INFO)
-        logging.getLogger().setLevel(log_level) 
-        for handler in logging.getLogger().handlers: 
-             handler.setLevel(log_level)
+        set_log_level(log_level)
         self.logger.info(f"Log level set to {log_level_str}")
 
         self.logger.info("DanteGPU starting up... 🚀")
         
         self.marketplace = MarketplaceConnector() 
-        self.latest_stats: dict = {} 
+        self.latest_stats: Optional[StatsPayload] = None 
+        self._stats_flush_scheduled = False # Coalesces bursts of stats updates into one repaint
+        self._last_tooltip = ""
+        self._gpu_status_dialog = None # Reused while latest_stats is the same payload object
+        self._gpu_status_stats: Optional[StatsPayload] = None
+        self._settings_dialog = None # Built on first open, then reloaded and re-exec'd
         self.connected_wallet: Optional[str] = self.config.get("wallet_address") # Load initial wallet address
 
         self.app = QApplication(sys.argv)
         self.app.setQuitOnLastWindowClosed(False) 
         self.apply_stylesheet() 
         
+        # Signals are emitted from the daemon/web server threads; queued delivery runs the slots on the GUI thread
         self.comm = Communicate()
-        self.comm.stats_update.connect(self.handle_stats_update) 
-        self.comm.wallet_update.connect(self.handle_wallet_update) # Connect wallet signal
-
-        # --- Queues ---
-        self.daemon_update_queue = queue.Queue() # For stats from daemon
-        self.wallet_update_queue = queue.Queue() # For wallet address from web server
+        self.comm.stats_update.connect(self.handle_stats_update, Qt.ConnectionType.QueuedConnection) 
+        self.comm.wallet_update.connect(self.handle_wallet_update, Qt.ConnectionType.QueuedConnection) # Connect wallet signal
 
         # --- Init Daemon ---
         self.daemon = BeatriceDaemon()
-        self.daemon.update_queue = self.daemon_update_queue # Pass the correct queue
+        self.daemon.update_callback = self.comm.stats_update.emit
         monitor_interval = self.config.get("monitoring_interval", 5) 
-        self.gpu_monitor_service = GPUMonitorService(monitoring_interval=monitor_interval)
+        self.gpu_monitor_service = GPUMonitorService(
+            monitoring_interval=monitor_interval,
+            enable_persistence_mode=self.config.get("nvml_enable_persistence_mode", False)
+        )
         self.daemon.register_service(self.gpu_monitor_service)
         
         # --- Init Web Server ---
         self.web_server_port = 51345 # Define port
         self.web_server_app_instance = None # To store the app instance for shutdown
-        self.web_server_thread = None
         self.local_server_url = f"http://127.0.0.1:{self.web_server_port}/connect"
+        self._browser_argv = _detect_browser_argv()
 
         # --- Init UI ---
-        gpu_status_message = None 
-        if not IS_MACOS and NVIDIA_AVAILABLE and not self.gpu_monitor_service.nvidia_initialized:
+        gpu_status_message = _NVIDIA_MISSING_MESSAGE 
+        if not GPU_CAPS.is_macos and GPU_CAPS.nvidia_available and not self.gpu_monitor_service.nvidia_initialized:
              gpu_status_message = "Warning: NVIDIA SMI failed to initialize. GPU monitoring may be limited."
              self.logger.warning(gpu_status_message)
-        elif not IS_MACOS and not NVIDIA_AVAILABLE:
-             gpu_status_message = "Info: NVIDIA library not found. GPU monitoring disabled."
         
         self.main_window = MainWindow(None, self.marketplace, gpu_status_message) 
         
@@ -90,74 +141,90 @@ class DanteGPU:
         
         self.setup_system_tray()
         
-        # --- Setup UI Update Timers ---
-        self.stats_update_timer = QTimer() # Renamed from ui_update_timer
-        self.stats_update_timer.timeout.connect(self.check_daemon_queue)
-        self.stats_update_timer.start(500) 
-
-        self.wallet_update_timer = QTimer() # Timer to check wallet queue
-        self.wallet_update_timer.timeout.connect(self.check_wallet_queue)
-        self.wallet_update_timer.start(600) # Check slightly less often
-
-        # --- Start Background Threads ---
-        self.daemon_thread = threading.Thread(target=self.run_daemon_async, daemon=True) 
-        self.daemon_thread.start()
-        
-        self.web_server_thread = threading.Thread(target=self.run_web_server_async, daemon=True)
-        self.web_server_thread.start()
+        # --- Start Background Work ---
+        # Daemon and web server share one asyncio loop on a dedicated thread; blocking calls it offloads
+        # (GPU collectors via run_in_executor) go to that loop's own bounded default executor
+        self._backend_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._backend_tasks: list[asyncio.Task] = []
+        self._web_stop_event: Optional[asyncio.Event] = None
+        self._backend_thread = threading.Thread(target=self.run_backend_async, name="dante-backend", daemon=True)
+        self._backend_thread.start()
         
         self.logger.info("DanteGPU initialization complete ✨")
 
-    def run_daemon_async(self):
-        self.logger.info("Starting BeatriceDaemon asyncio loop in background thread...")
+    def run_backend_async(self):
+        self.logger.info("Starting backend asyncio loop (daemon + local web server) in background thread...")
+        loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        executor = ThreadPoolExecutor(max_workers=BACKEND_WORKERS, thread_name_prefix="dante-bg")
+        loop.set_default_executor(executor)
+        self._backend_loop = loop
         try:
-            asyncio.run(self.daemon.start())
+            loop.run_until_complete(self._run_backend())
         except Exception as e:
-            self.logger.critical(f"BeatriceDaemon thread crashed: {e}", exc_info=True)
+            self.logger.critical(f"Backend thread crashed: {e}", exc_info=True)
         finally:
-             self.logger.info("BeatriceDaemon asyncio loop finished.")
-             
-    def run_web_server_async(self):
-        self.logger.info("Starting Local Web Server asyncio loop in background thread...")
+             try:
+                  loop.run_until_complete(loop.shutdown_default_executor()) # Joins the pool from the thread that owns it
+             except Exception as e:
+                  self.logger.error(f"Error shutting down backend executor: {e}")
+             loop.close()
+             self.logger.info("Backend asyncio loop finished.")
+
+    async def _run_backend(self):
+        self._web_stop_event = asyncio.Event() # Created here so it belongs to the backend loop
+        self._backend_tasks = [
+            asyncio.create_task(self.daemon.start(), name="BeatriceDaemon"),
+            asyncio.create_task(self._run_web_server(), name="LocalWebServer"),
+        ]
+        await asyncio.gather(*self._backend_tasks, return_exceptions=True)
+
+    async def _run_web_server(self):
         try:
-            # Need to get the app instance back to stop it later
-            # Modifying start_local_server or running differently might be needed
-            # For now, run it directly, shutdown might be abrupt
-            asyncio.run(start_local_server(port=self.web_server_port, update_queue=self.wallet_update_queue))
+            await start_local_server(
+                port=self.web_server_port,
+                update_callback=self.comm.wallet_update.emit,
+                stop_event=self._web_stop_event
+            )
         except OSError:
              self.logger.error(f"Web server port {self.web_server_port} likely already in use.")
              # TODO: Communicate this error to the UI?
         except Exception as e:
-            self.logger.critical(f"Local Web Server thread crashed: {e}", exc_info=True)
+            self.logger.critical(f"Local Web Server crashed: {e}", exc_info=True)
         finally:
-             self.logger.info("Local Web Server asyncio loop finished.")
+             self.logger.info("Local Web Server finished.")
 
-    def check_daemon_queue(self):
+    async def _stop_backend(self):
+        # Let the web server close its runner and release the port instead of being cancelled mid-request
+        if self._web_stop_event is not None:
+            self._web_stop_event.set()
         try:
-            stats_data = self.daemon_update_queue.get_nowait() 
-            self.comm.stats_update.emit(stats_data) 
-        except queue.Empty: 
-            pass 
+            await self.daemon.stop()
         except Exception as e:
-            self.logger.error(f"Error checking daemon queue: {e}", exc_info=True)
-            
-    def check_wallet_queue(self):
+            self.logger.error(f"Error stopping daemon: {e}")
+        if not self._backend_tasks: return
+        daemon_task, web_task = self._backend_tasks
+        daemon_task.cancel() # Otherwise it idles out its current 5 s health sleep
         try:
-            wallet_data = self.wallet_update_queue.get_nowait() 
-            if wallet_data.get("type") == "wallet_update":
-                 address = wallet_data.get("address")
-                 if address:
-                      self.comm.wallet_update.emit(address)
-        except queue.Empty: 
-            pass 
-        except Exception as e:
-            self.logger.error(f"Error checking wallet queue: {e}", exc_info=True)
+            await asyncio.wait_for(asyncio.shield(web_task), timeout=2.0)
+        except asyncio.TimeoutError:
+            self.logger.warning("Timeout waiting for local web server shutdown; cancelling.")
+            web_task.cancel()
+        except Exception:
+            pass # Already logged by _run_web_server
 
-    def handle_stats_update(self, stats_data: dict):
+    def handle_stats_update(self, stats_data: StatsPayload):
         self.logger.debug("Received stats update from daemon.")
         self.latest_stats = stats_data 
-        self.main_window.update_stats(stats_data)
-        self.update_tray_tooltip(stats_data) 
+        if not self._stats_flush_scheduled:
+             self._stats_flush_scheduled = True
+             QTimer.singleShot(STATS_FLUSH_DELAY_MS, self._flush_stats)
+
+    def _flush_stats(self):
+        # Only the newest payload is rendered; anything that arrived in between is dropped
+        self._stats_flush_scheduled = False
+        self.main_window.update_stats(self.latest_stats)
+        self.update_tray_tooltip(self.latest_stats) 
         
     def handle_wallet_update(self, address: str):
         self.logger.info(f"Received wallet address update: {address}")
@@ -180,45 +247,31 @@ class DanteGPU:
 
 
     def apply_stylesheet(self):
-        stylesheet = """
-            QWidget { background-color: #2b2b2b; color: #f0f0f0; font-size: 11pt; }
-            QMainWindow { background-color: #3c3f41; }
-            QGroupBox { background-color: #3c3f41; border: 1px solid #555; border-radius: 5px; margin-top: 1ex; font-weight: bold; }
-            QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; padding: 0 3px; background-color: #555; color: #f0f0f0; border-radius: 3px; }
-            QLabel { background-color: transparent; }
-            QTableWidget { background-color: #3c3f41; border: 1px solid #555; gridline-color: #555; alternate-background-color: #45494c; }
-            QHeaderView::section { background-color: #555; color: #f0f0f0; padding: 4px; border: 1px solid #3c3f41; font-weight: bold; }
-            QTableWidget::item { padding: 5px; }
-            QProgressBar { border: 1px solid #555; border-radius: 5px; text-align: center; background-color: #45494c; color: #f0f0f0; }
-            QProgressBar::chunk { background-color: #007bff; width: 10px; margin: 0.5px; border-radius: 4px; }
-            QToolTip { background-color: #2b2b2b; color: #f0f0f0; border: 1px solid #555; }
-            QMenu { background-color: #3c3f41; border: 1px solid #555; }
-            QMenu::item { padding: 5px 20px; }
-            QMenu::item:selected { background-color: #007bff; }
-            QMenu::separator { height: 1px; background: #555; margin-left: 10px; margin-right: 5px; }
-            QPushButton { padding: 5px 10px; background-color: #007bff; color: white; border: none; border-radius: 3px; }
-            QPushButton:hover { background-color: #0056b3; }
-            QPushButton:disabled { background-color: #555; }
-        """
-        self.app.setStyleSheet(stylesheet)
+        self.app.setStyleSheet(_STYLESHEET)
 
     def setup_system_tray(self):
         self.tray = QSystemTrayIcon()
-        icon_path = Path(__file__).resolve().parent / "resources" / "icons" / "tray_icon.png"
-        if not icon_path.is_file():
-             self.logger.warning(f"Tray icon not found at {icon_path}, attempting to use a default system icon.")
-             fallback_icon = QIcon.fromTheme("dialog-information") 
-             if not fallback_icon.isNull(): 
-                 self.tray.setIcon(fallback_icon)
-             else:
-                  self.logger.error("Could not load default system tray icon.")
+        icon = self._get_cached_icon()
+        if not icon.isNull():
+             self.tray.setIcon(icon)
         else:
-             self.tray.setIcon(QIcon(str(icon_path)))
+             self.logger.error("Could not load default system tray icon.")
         self.tray.setToolTip("DanteGPU - GPU Mining Done Right 🎮")
         menu = self.create_tray_menu()
         self.tray.setContextMenu(menu)
         self.tray.show()
 
+    def _get_cached_icon(self) -> QIcon:
+        if DanteGPU._tray_icon is None:
+             if QResource.registerResource(str(_RESOURCES_RCC)):
+                  DanteGPU._tray_icon = QIcon(_TRAY_ICON_RESOURCE)
+             elif _TRAY_ICON_PATH.is_file():
+                  DanteGPU._tray_icon = QIcon(str(_TRAY_ICON_PATH))
+             else:
+                  self.logger.warning(f"Tray icon not found at {_TRAY_ICON_PATH}, attempting to use a default system icon.")
+                  DanteGPU._tray_icon = QIcon.fromTheme("dialog-information") 
+        return DanteGPU._tray_icon
+
     def create_tray_menu(self):
         menu = QMenu()
         dashboard_action = QAction("Dashboard 📊", self.app)
@@ -236,34 +289,42 @@ class DanteGPU:
         menu.addAction(exit_action)
         return menu
 
-    def update_tray_tooltip(self, stats):
-        tooltip = "DanteGPU Status:\n"
-        tooltip += f"GPUs Active: {stats.get('active_gpus', 'N/A')}\n" 
-        tooltip += f"Total Earnings: {stats.get('total_earnings', 0.0):.4f} SOL" 
-        self.tray.setToolTip(tooltip)
+    def update_tray_tooltip(self, stats: StatsPayload):
+        tooltip = f"DanteGPU Status:\nGPUs Active: {stats.active_gpus}\nTotal Earnings: {stats.total_earnings:.4f} SOL"
+        if tooltip != self._last_tooltip: # Skip the Qt property update when nothing changed
+            self.tray.setToolTip(tooltip)
+            self._last_tooltip = tooltip
 
     def show_gpu_status(self):
         self.logger.info("Opening detailed GPU status dialog.")
-        dialog = GPUStatusDialog(self.latest_stats, self.main_window) 
-        dialog.exec() 
+        # The monitor publishes a new StatsPayload only when something changed, so identity is the fingerprint
+        if self._gpu_status_dialog is None or self._gpu_status_stats is not self.latest_stats:
+             from ui.gpu_status_dialog import GPUStatusDialog # Deferred: only needed once the user opens it
+             if self._gpu_status_dialog is not None:
+                  self._gpu_status_dialog.deleteLater()
+             self._gpu_status_dialog = GPUStatusDialog(self.latest_stats, self.main_window)
+             self._gpu_status_stats = self.latest_stats
+        self._gpu_status_dialog.exec() 
         self.logger.info("Detailed GPU status dialog closed.")
 
     def show_settings(self):
         self.logger.info("Opening settings dialog.")
-        dialog = SettingsDialog(self.main_window) 
-        if dialog.exec():
+        if self._settings_dialog is None:
+             from ui.settings_dialog import SettingsDialog # Deferred: only needed once the user opens it
+             self._settings_dialog = SettingsDialog(self.main_window, config=self.config) # __init__ loads the settings
+        else:
+             self._settings_dialog.load_settings()
+        if self._settings_dialog.exec():
             self.logger.info("Settings dialog accepted (saved).")
             new_level_str = self.config.get("log_level", "INFO").upper()
             new_level = getattr(logging, new_level_str, logging.INFO)
             if logging.getLogger().level != new_level:
                  self.logger.info(f"Log level changed to {new_level_str}. Applying...")
-                 logging.getLogger().setLevel(new_level)
-                 for handler in logging.getLogger().handlers:
-                      handler.setLevel(new_level)
+                 set_log_level(new_level)
             
             new_interval = self.config.get("monitoring_interval", 5)
             if self.gpu_monitor_service.monitoring_interval != new_interval:
-                 self.logger.info(f"Monitoring interval changed to {new_interval} seconds. Applying...")
+                 self.logger.debug(f"Monitoring interval changed to {new_interval} seconds. Applying...")
                  self.gpu_monitor_service.monitoring_interval = new_interval
         else:
             self.logger.info("Settings dialog cancelled.")
@@ -272,7 +333,17 @@ class DanteGPU:
     def open_wallet_connect_page(self):
          self.logger.info(f"Opening wallet connection page in browser: {self.local_server_url}")
          try:
-              webbrowser.open(self.local_server_url)
+              if self._browser_argv:
+                   proc = subprocess.Popen(
+                        [*self._browser_argv, self.local_server_url],
+                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                        close_fds=True, start_new_session=True
+                   )
+                   # The opener exits as soon as it hands the URL off; reap it off the GUI thread so it doesn't linger as a zombie
+                   threading.Thread(target=proc.wait, name="dante-url-opener", daemon=True).start()
+              else:
+                   import webbrowser # Fallback only (e.g. Windows); not worth importing at startup
+                   webbrowser.open(self.local_server_url)
          except Exception as e:
               self.logger.error(f"Failed to open web browser: {e}", exc_info=True)
               # Show error message to user?
@@ -280,34 +351,17 @@ class DanteGPU:
     def cleanup_and_exit(self):
         self.logger.info("Shutting down DanteGPU... 👋")
         
-        # Stop Daemon Thread
-        if self.daemon_thread and self.daemon_thread.is_alive():
-             self.logger.info("Requesting daemon stop...")
+        # Stop daemon and web server on the backend loop
+        if self._backend_thread.is_alive() and self._backend_loop is not None:
+             self.logger.info("Requesting backend stop...")
              try:
-                  loop = asyncio.get_event_loop_policy().get_event_loop() 
-                  if loop.is_running():
-                       future = asyncio.run_coroutine_threadsafe(self.daemon.stop(), loop)
-                       self.logger.info("Daemon stop scheduled.")
-                       try: future.result(timeout=7.0) 
-                       except TimeoutError: self.logger.warning("Timeout waiting for daemon stop.")
-                       except Exception as fe: self.logger.error(f"Error waiting for daemon stop future: {fe}")
-                  else:
-                       self.logger.warning("Daemon loop not running.")
-                       if hasattr(self.daemon, '_is_running'): self.daemon._is_running = False 
+                  future = asyncio.run_coroutine_threadsafe(self._stop_backend(), self._backend_loop)
+                  future.result(timeout=7.0)
+                  self.logger.info("Backend stopped.")
+             except TimeoutError:
+                  self.logger.warning("Timeout waiting for backend stop.")
              except RuntimeError as e:
-                  self.logger.warning(f"Could not get loop to schedule daemon stop: {e}.")
-                  if hasattr(self.daemon, '_is_running'): self.daemon._is_running = False
-             except Exception as e:
-                  self.logger.error(f"Error scheduling daemon stop: {e}")
-                  if hasattr(self.daemon, '_is_running'): self.daemon._is_running = False 
-
-        # Stop Web Server Thread (Needs improvement in local_server.py for graceful shutdown)
-        if self.web_server_thread and self.web_server_thread.is_alive():
-             self.logger.info("Stopping local web server (may be abrupt)...")
-             # Currently no clean way to stop the asyncio.run() from another thread
-             # The thread is daemonized, so it should exit when main app exits, but cleanup won't run.
-             # TODO: Implement proper shutdown signal for web server if needed.
-             pass 
+                  self.logger.warning(f"Backend loop already closed: {e}.")
 
         self.marketplace.disconnect() 
         self.tray.hide()
@@ -323,15 +377,11 @@ class DanteGPU:
             exit_code = self.app.exec()
             self.logger.info(f"Qt application event loop finished with exit code {exit_code}.")
             
-            # Ensure background threads are joined after event loop finishes
-            if self.daemon_thread and self.daemon_thread.is_alive():
-                 self.logger.info("Waiting for daemon thread to exit...")
-                 self.daemon_thread.join(timeout=5.0) 
-                 if self.daemon_thread.is_alive(): self.logger.warning("Daemon thread did not exit cleanly.")
-            if self.web_server_thread and self.web_server_thread.is_alive():
-                 self.logger.info("Waiting for web server thread to exit...")
-                 self.web_server_thread.join(timeout=2.0) # Shorter timeout for web server
-                 if self.web_server_thread.is_alive(): self.logger.warning("Web server thread did not exit cleanly.")
+            # Ensure the backend loop has finished after event loop finishes
+            if self._backend_thread.is_alive():
+                 self.logger.info("Waiting for backend thread to exit...")
+                 self._backend_thread.join(timeout=7.0)
+                 if self._backend_thread.is_alive(): self.logger.warning("Backend thread did not exit cleanly.")
                  
             return exit_code
             
@@ -340,17 +390,8 @@ class DanteGPU:
             # Ensure cleanup is attempted even on crash
             self.cleanup_and_exit() 
             return 1
-
-IS_MACOS = platform.system() == "Darwin"
-NVIDIA_AVAILABLE = False
-if not IS_MACOS:
-    try:
-        import nvidia_smi
-        NVIDIA_AVAILABLE = True
-    except ImportError:
-        pass 
-    except Exception:
-         pass 
+        finally:
+            stop_log_listeners()
 
 if __name__ == "__main__":
     dante_gpu = DanteGPU()
@@ -1,19 +1,31 @@
+import html
 import logging
 import platform
-from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QScrollArea, QWidget, QGridLayout, 
+from operator import attrgetter
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QScrollArea, QWidget, 
                              QLabel, QDialogButtonBox, QGroupBox, QSizePolicy)
 from PyQt6.QtCore import Qt
 
 try:
+    from ..daemon.stats import GpuStats, StatsPayload
     from ..utils.helpers import format_bytes
 except ImportError:
+    from daemon.stats import GpuStats, StatsPayload
     from utils.helpers import format_bytes
 
+logger = logging.getLogger(__name__)
+
+_get_live_fields = attrgetter('id', 'temperature', 'utilization', 'memory_used', 'memory_total', 'power_usage', 'fan_speed')
+_get_static_fields = attrgetter('model', 'vendor', 'vram', 'device_id', 'vendor_id', 'bus', 'metal_family')
+
+_IS_MACOS = platform.system() == "Darwin"
+_UTIL_LABEL = "Overall CPU Usage:" if _IS_MACOS else "GPU Utilization:"
+_MEM_LABEL = "System Memory Usage:" if _IS_MACOS else "GPU Memory Usage:"
+
 class GPUStatusDialog(QDialog):
-    def __init__(self, current_stats: dict | None, parent=None):
+    def __init__(self, current_stats: StatsPayload | None, parent=None):
         super().__init__(parent)
-        self.current_stats = current_stats if current_stats else {}
-        self.logger = logging.getLogger(__name__)
+        self.current_stats = current_stats
 
         self.setWindowTitle("Detailed GPU Status")
         self.setMinimumSize(500, 400)
@@ -35,11 +47,11 @@ class GPUStatusDialog(QDialog):
         main_layout.addWidget(button_box)
 
         self.populate_gpu_details()
-        self.logger.debug("GPUStatusDialog initialized.")
+        logger.debug("GPUStatusDialog initialized.")
 
     def populate_gpu_details(self):
         try:
-            gpu_list = self.current_stats.get('gpus', [])
+            gpu_list = self.current_stats.gpus if self.current_stats else []
 
             if not gpu_list:
                 self.content_layout.addWidget(QLabel("No GPU information available."))
@@ -52,29 +64,15 @@ class GPUStatusDialog(QDialog):
             self.content_layout.addStretch(1) 
 
         except Exception as e:
-            self.logger.error(f"Error populating GPU status dialog: {e}")
+            logger.error(f"Error populating GPU status dialog: {e}")
             self.content_layout.addWidget(QLabel(f"Error loading GPU details: {e}"))
 
-    def _create_gpu_group(self, gpu_data: dict) -> QGroupBox:
-        gpu_id = gpu_data.get('id', 'N/A')
-        model = gpu_data.get('model', 'N/A')
+    def _create_gpu_group(self, gpu: GpuStats) -> QGroupBox:
+        gpu_id, temp, util, mem_used, mem_total, power, fan = _get_live_fields(gpu)
+        model, vendor, vram_str, device_id, vendor_id, bus, metal = _get_static_fields(gpu.static)
         
         group_box = QGroupBox(f"GPU [{gpu_id}]: {model}")
-        group_layout = QGridLayout(group_box)
-
-        temp = gpu_data.get('temperature')
-        util = gpu_data.get('utilization')
-        mem_used = gpu_data.get('memory_used')
-        mem_total = gpu_data.get('memory_total')
-        power = gpu_data.get('power_usage')
-        fan = gpu_data.get('fan_speed')
-        
-        vendor = gpu_data.get('vendor', 'N/A')
-        vram_str = gpu_data.get('vram', 'N/A') 
-        device_id = gpu_data.get('device_id', 'N/A')
-        vendor_id = gpu_data.get('vendor_id', 'N/A')
-        bus = gpu_data.get('bus', 'N/A')
-        metal = gpu_data.get('metal_family', 'N/A')
+        group_layout = QVBoxLayout(group_box)
 
         temp_str = f"{temp}°C" if temp is not None else "N/A"
         util_str = f"{util}%" if util is not None else "N/A" 
@@ -82,83 +80,56 @@ class GPUStatusDialog(QDialog):
         power_str = f"{power:.1f} W" if power is not None else "N/A"
         fan_str = f"{fan}%" if fan is not None else "N/A"
 
-        row = 0
-        group_layout.addWidget(QLabel("Model:"), row, 0)
-        group_layout.addWidget(QLabel(model), row, 1)
-        row += 1
-        group_layout.addWidget(QLabel("Vendor:"), row, 0)
-        group_layout.addWidget(QLabel(f"{vendor} (ID: {vendor_id})"), row, 1)
-        row += 1
-        group_layout.addWidget(QLabel("VRAM:"), row, 0)
-        group_layout.addWidget(QLabel(vram_str), row, 1)
-        row += 1
-        group_layout.addWidget(QLabel("Device ID:"), row, 0)
-        group_layout.addWidget(QLabel(device_id), row, 1)
-        row += 1
-        group_layout.addWidget(QLabel("Bus Info:"), row, 0)
-        group_layout.addWidget(QLabel(bus), row, 1)
-        row += 1
-        group_layout.addWidget(QLabel("Metal Family:"), row, 0)
-        group_layout.addWidget(QLabel(metal), row, 1) # Relevant for macOS
-        row += 1
+        rows = [
+            ("Model:", model),
+            ("Vendor:", f"{vendor} (ID: {vendor_id})"),
+            ("VRAM:", vram_str),
+            ("Device ID:", device_id),
+            ("Bus Info:", bus),
+            ("Metal Family:", metal), # Relevant for macOS
+        ]
         
         # Add WMI specific fields if present
-        wmi_driver = gpu_data.get('wmi_driver_version')
-        wmi_processor = gpu_data.get('wmi_video_processor')
-        wmi_ram_bytes = gpu_data.get('wmi_adapter_ram')
-        wmi_resolution = gpu_data.get('wmi_resolution')
-        wmi_refresh = gpu_data.get('wmi_refresh_rate')
+        wmi = gpu.wmi or {}
+        wmi_driver = wmi.get('wmi_driver_version')
+        wmi_processor = wmi.get('wmi_video_processor')
+        wmi_ram_bytes = wmi.get('wmi_adapter_ram')
+        wmi_resolution = wmi.get('wmi_resolution')
+        wmi_refresh = wmi.get('wmi_refresh_rate')
         
         if wmi_driver:
-             group_layout.addWidget(QLabel("Driver (WMI):"), row, 0)
-             group_layout.addWidget(QLabel(wmi_driver), row, 1)
-             row += 1
+             rows.append(("Driver (WMI):", wmi_driver))
         if wmi_processor:
-             group_layout.addWidget(QLabel("Processor (WMI):"), row, 0)
-             group_layout.addWidget(QLabel(wmi_processor), row, 1)
-             row += 1
+             rows.append(("Processor (WMI):", wmi_processor))
         if wmi_ram_bytes:
-             group_layout.addWidget(QLabel("Adapter RAM (WMI):"), row, 0)
-             group_layout.addWidget(QLabel(format_bytes(wmi_ram_bytes)), row, 1)
-             row += 1
+             rows.append(("Adapter RAM (WMI):", format_bytes(wmi_ram_bytes)))
         if wmi_resolution and wmi_resolution != '?x?':
-             group_layout.addWidget(QLabel("Resolution (WMI):"), row, 0)
-             group_layout.addWidget(QLabel(wmi_resolution), row, 1)
-             row += 1
+             rows.append(("Resolution (WMI):", wmi_resolution))
         if wmi_refresh:
-             group_layout.addWidget(QLabel("Refresh Rate (WMI):"), row, 0)
-             group_layout.addWidget(QLabel(f"{wmi_refresh} Hz"), row, 1)
-             row += 1
+             rows.append(("Refresh Rate (WMI):", f"{wmi_refresh} Hz"))
              
         # Standard metrics
-        group_layout.addWidget(QLabel("Temperature:"), row, 0)
-        group_layout.addWidget(QLabel(temp_str), row, 1)
-        row += 1
-        
-        is_macos = platform.system() == "Darwin"
-        util_label_text = "Overall CPU Usage:" if is_macos else "GPU Utilization:"
-        mem_label_text = "System Memory Usage:" if is_macos else "GPU Memory Usage:"
-        
-        group_layout.addWidget(QLabel(util_label_text), row, 0)
-        group_layout.addWidget(QLabel(util_str), row, 1)
-        row += 1
-        group_layout.addWidget(QLabel(mem_label_text), row, 0)
-        group_layout.addWidget(QLabel(mem_str), row, 1)
-        row += 1
-        group_layout.addWidget(QLabel("Power Draw:"), row, 0)
-        group_layout.addWidget(QLabel(power_str), row, 1)
-        row += 1
-        group_layout.addWidget(QLabel("Fan Speed:"), row, 0)
-        group_layout.addWidget(QLabel(fan_str), row, 1)
-        row += 1
-
-        if is_macos:
+        rows.extend((
+            ("Temperature:", temp_str),
+            (_UTIL_LABEL, util_str),
+            (_MEM_LABEL, mem_str),
+            ("Power Draw:", power_str),
+            ("Fan Speed:", fan_str),
+        ))
+
+        # One rich-text label per GPU instead of a grid of ~2 labels per field
+        details_label = QLabel(
+            "<table cellspacing='2'>"
+            + "".join(f"<tr><td>{html.escape(label)}</td><td>{html.escape(str(value))}</td></tr>" for label, value in rows)
+            + "</table>"
+        )
+        details_label.setTextFormat(Qt.TextFormat.RichText)
+        group_layout.addWidget(details_label)
+
+        if _IS_MACOS:
             note_label = QLabel("Note: Detailed GPU Util/Power requires running\n`sudo python3 src/cli/macgpustat.py` in terminal.")
             note_label.setStyleSheet("font-style: italic; color: #aaa;")
             note_label.setWordWrap(True)
-            group_layout.addWidget(note_label, row, 0, 1, 2)
-            row += 1
-
-        group_layout.setColumnStretch(1, 1) 
+            group_layout.addWidget(note_label)
 
         return group_box
@@ -1,40 +1,245 @@
 import logging
 import platform 
-import webbrowser # Re-add webbrowser
 import urllib.parse # Re-add urllib.parse
-from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QLabel, QTableWidget, 
-                             QTableWidgetItem, QHeaderView, QGroupBox, QHBoxLayout,
-                             QProgressBar, QApplication, QPushButton) # Re-add QPushButton
-from PyQt6.QtCore import Qt, QTimer # Ensure QTimer is imported
+from operator import attrgetter
+from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QLabel, QTableView, QAbstractItemView,
+                             QHeaderView, QGroupBox, QHBoxLayout, QStyledItemDelegate,
+                             QPushButton) # Re-add QPushButton
+from PyQt6.QtGui import QColor, QPainter, QPixmap, QPixmapCache
+from PyQt6.QtCore import (Qt, QTimer, QAbstractTableModel, QModelIndex, QRectF, QObject, QRunnable,
+                          QThreadPool, pyqtSignal) # Ensure QTimer is imported
 
 try:
+    from ..daemon.stats import GpuStats, StatsPayload
     from ..utils.helpers import format_bytes
 except ImportError:
+    from daemon.stats import GpuStats, StatsPayload
     from utils.helpers import format_bytes 
 
-class TableProgressBar(QProgressBar):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setStyleSheet("""
-            QProgressBar {
-                text-align: center;
-                padding: 1px;
-                border-radius: 5px;
-                background-color: #45494c; 
-                color: #f0f0f0; 
-            }
-            QProgressBar::chunk {
-                background-color: #007bff; 
-                border-radius: 4px;
-                margin: 0.5px;
-            }
-        """)
-
-    def text(self) -> str:
-        if self.maximum() == 0:
-            return "N/A"
-        return f"{self.value()}%"
+logger = logging.getLogger(__name__)
+
+_PHANTOM_APP_URL = urllib.parse.quote("https://dantegpu.app") # Placeholder app URL
+_PHANTOM_REDIRECT_URL = urllib.parse.quote("dantegpu://connection-success") # Placeholder redirect
+# Built once at import; the parameters never change between clicks
+_PHANTOM_URI = f"phantom://v1/connect?app_url={_PHANTOM_APP_URL}&redirect_link={_PHANTOM_REDIRECT_URL}"
+
+# Per-row fields pulled from a GpuStats in one C-level call
+_get_gpu_fields = attrgetter('id', 'static.model', 'temperature', 'utilization', 'memory_used', 'memory_total', 'power_usage', 'fan_speed')
+
+# Volatile fields that decide whether a tick changes anything on screen
+_get_gpu_signature = attrgetter('id', 'temperature', 'utilization', 'memory_used', 'memory_total', 'power_usage', 'fan_speed')
+
+TABLE_ROW_HEIGHT = 28 # Fixed row height; the view never asks cells for a sizeHint
+
+_IS_MACOS = platform.system() == "Darwin"
+_HEADERS = ("ID", "Model", "Temp (°C)", "CPU (%)" if _IS_MACOS else "Util (%)", "Sys Mem" if _IS_MACOS else "Memory", "Power (W)", "Fan (%)")
+_RESIZE_MODES = (
+    QHeaderView.ResizeMode.ResizeToContents, QHeaderView.ResizeMode.Stretch, QHeaderView.ResizeMode.ResizeToContents,
+    QHeaderView.ResizeMode.Stretch, QHeaderView.ResizeMode.Stretch,
+    QHeaderView.ResizeMode.ResizeToContents, QHeaderView.ResizeMode.ResizeToContents,
+)
+
+TEMP_COLUMN = 2
+UTIL_COLUMN = 3
+MEM_COLUMN = 4
+POWER_COLUMN = 5
+FAN_COLUMN = 6
+_CENTERED_COLUMNS = frozenset((TEMP_COLUMN, UTIL_COLUMN, MEM_COLUMN, POWER_COLUMN, FAN_COLUMN))
+# Row tuple index of the percentage painted by ProgressBarDelegate, per column
+_PERCENT_FIELDS = {UTIL_COLUMN: 7, MEM_COLUMN: 8}
+# Qt enum members resolved once; data() runs for every visible cell on each repaint
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_USER_ROLE = Qt.ItemDataRole.UserRole
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+# Row tuple field -> view column; the two trailing percentages belong to the progress bar columns
+_FIELD_COLUMNS = (0, 1, TEMP_COLUMN, UTIL_COLUMN, MEM_COLUMN, POWER_COLUMN, FAN_COLUMN, UTIL_COLUMN, MEM_COLUMN)
+
+class GPUStatsModel(QAbstractTableModel):
+    """Read-only table model over the latest GPU samples; the view only asks for cells it paints."""
+
+    def __init__(self, headers: tuple[str, ...], parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        # Per row: 7 display values (raw numbers for temp/power/fan) + (util %, memory %) for the progress bar delegate
+        self._rows: list[tuple] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role=_DISPLAY_ROLE):
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role == _DISPLAY_ROLE:
+            return self._rows[index.row()][column]
+        if role == _USER_ROLE:
+            percent_field = _PERCENT_FIELDS.get(column)
+            return self._rows[index.row()][percent_field] if percent_field is not None else None
+        if role == _ALIGNMENT_ROLE and column in _CENTERED_COLUMNS:
+            return _ALIGN_CENTER
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return None
+
+    def set_rows(self, rows: list[tuple]):
+        old_rows = self._rows
+        old_count, new_count = len(old_rows), len(rows)
+        # Row count changes are announced as one insert/remove range, never row by row or as a full reset
+        if new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._rows = rows
+            self.endInsertRows()
+        elif new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            self._rows = rows
+            self.endRemoveRows()
+        else:
+            self._rows = rows
+        self._emit_changed_cells(old_rows, rows)
+
+    def _emit_changed_cells(self, old_rows: list[tuple], new_rows: list[tuple]):
+        """Emit one dataChanged covering only the cells that differ from the previous snapshot, if any."""
+        first_row = last_row = None
+        columns = set()
+        for row, (old, new) in enumerate(zip(old_rows, new_rows)):
+            if old == new:
+                continue
+            if first_row is None:
+                first_row = row
+            last_row = row
+            columns.update(_FIELD_COLUMNS[i] for i, (a, b) in enumerate(zip(old, new)) if a != b)
+        if first_row is not None:
+            self.dataChanged.emit(self.index(first_row, min(columns)), self.index(last_row, max(columns)))
+
+
+class NumericDelegate(QStyledItemDelegate):
+    """Formats raw numbers from the model at paint time, only for visible cells."""
+
+    def __init__(self, decimals: int | None = None, parent=None):
+        super().__init__(parent)
+        self._decimals = decimals
+
+    def displayText(self, value, locale) -> str:
+        if isinstance(value, (int, float)):
+            if self._decimals is not None:
+                return locale.toString(float(value), 'f', self._decimals)
+            return locale.toString(value)
+        return super().displayText(value, locale)
+
+
+class ProgressBarDelegate(QStyledItemDelegate):
+    """Paints a percentage (UserRole) as a rounded bar with the cell's display text; no per-cell widget."""
+    # Same palette the old per-widget QProgressBar stylesheet used; built once, not per paint
+    _BACKGROUND = QColor("#45494c")
+    _CHUNK = QColor("#007bff")
+    _TEXT = QColor("#f0f0f0")
+
+    def paint(self, painter, option, index):
+        percent = index.data(_USER_ROLE)
+        rect = QRectF(option.rect.adjusted(2, 2, -2, -2))
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._BACKGROUND)
+        painter.drawRoundedRect(rect, 5, 5)
+        if percent:
+            # Blit the filled portion of a pre-rendered full-width chunk instead of rasterizing it per paint
+            dpr = painter.device().devicePixelRatioF()
+            sprite = self._chunk_sprite(option.rect.width() - 4, option.rect.height() - 4, dpr)
+            fraction = min(percent, 100) / 100
+            painter.drawPixmap(
+                QRectF(rect.x(), rect.y(), rect.width() * fraction, rect.height()),
+                sprite,
+                QRectF(0, 0, sprite.width() * fraction, sprite.height()),
+            )
+        painter.setPen(self._TEXT)
+        painter.setFont(option.font)
+        painter.drawText(rect, _ALIGN_CENTER, index.data(_DISPLAY_ROLE) or "")
+        painter.restore()
+
+    def _chunk_sprite(self, width: int, height: int, dpr: float) -> QPixmap:
+        key = f"dante_progress_chunk_{width}x{height}@{dpr}"
+        sprite = QPixmapCache.find(key)
+        if sprite is None:
+            sprite = QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+            sprite.setDevicePixelRatio(dpr)
+            sprite.fill(Qt.GlobalColor.transparent)
+            sprite_painter = QPainter(sprite)
+            sprite_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            sprite_painter.setPen(Qt.PenStyle.NoPen)
+            sprite_painter.setBrush(self._CHUNK)
+            sprite_painter.drawRoundedRect(QRectF(0.5, 0.5, width - 1, height - 1), 4, 4)
+            sprite_painter.end()
+            QPixmapCache.insert(key, sprite)
+        return sprite
+
+
+_NA = "N/A"
+# Bound str.format templates for the per-tick strings
+_FMT_ACTIVE_GPUS = "Active GPUs: {}".format
+_FMT_EARNINGS = "Total Earnings: {:.4f} SOL".format
+_FMT_PERCENT = "{}%".format
+_FMT_MEMORY = "{} / {}".format
+
+def _build_row(gpu: GpuStats) -> tuple:
+    """Turn one GpuStats into the GPUStatsModel row tuple (display values + util/memory percentages)."""
+    gpu_id, model, temp, util, mem_used, mem_total, power, fan = _get_gpu_fields(gpu)
+
+    util_pct = None
+    if util is not None:
+        try:
+             util_pct = int(float(util)) # Handle potential float like CPU %
+        except (ValueError, TypeError):
+             logger.warning("Invalid utilization value for progress bar: %r", util)
+
+    mem_pct = None
+    mem_str = _NA
+    if mem_used is not None and mem_total is not None and mem_total > 0:
+        try:
+             mem_pct = int((mem_used / mem_total) * 100)
+             mem_str = _FMT_MEMORY(format_bytes(mem_used), format_bytes(mem_total))
+        except (ValueError, TypeError, ZeroDivisionError) as e:
+             logger.warning("Invalid memory value for progress bar: used=%r, total=%r, error=%s", mem_used, mem_total, e)
+             mem_str = "Error"
+
+    return (
+        str(gpu_id),
+        model,
+        _NA if temp is None else temp,
+        _NA if util_pct is None else _FMT_PERCENT(util_pct),
+        mem_str,
+        _NA if power is None else power,
+        _NA if fan is None else fan,
+        util_pct,
+        mem_pct,
+    )
+
+
+class _OpenUrlSignals(QObject):
+    finished = pyqtSignal(bool) # webbrowser.open() result, delivered on the GUI thread
+
+
+class _OpenUrlTask(QRunnable):
+    def __init__(self, url: str):
+        super().__init__()
+        self._url = url
+        self.signals = _OpenUrlSignals()
+
+    def run(self):
+        import webbrowser # Deferred: only needed on the rare Connect Phantom click
+        try:
+            opened = webbrowser.open(self._url)
+        except Exception as e:
+            logger.error("Failed to open URI %s: %s", self._url, e, exc_info=True)
+            opened = False
+        self.signals.finished.emit(opened)
 
 
 class MainWindow(QMainWindow):
@@ -42,7 +247,6 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.gpu_handler = gpu_handler # Still needed for GPUStatusDialog currently
         self.marketplace = marketplace
-        self.logger = logging.getLogger(__name__)
         
         self.setWindowTitle("DanteGPU Beatrice Dashboard")
         self.setMinimumSize(800, 600)
@@ -83,150 +287,89 @@ class MainWindow(QMainWindow):
         
         main_layout.addWidget(summary_group)
         
-        self.gpu_table = QTableWidget()
-        self.gpu_table.setColumnCount(7) 
-        
-        is_macos = platform.system() == "Darwin"
-        util_header = "CPU (%)" if is_macos else "Util (%)"
-        mem_header = "Sys Mem" if is_macos else "Memory"
-        self.gpu_table.setHorizontalHeaderLabels([
-            "ID", "Model", "Temp (°C)", util_header, mem_header, "Power (W)", "Fan (%)"
-        ])
-        self.gpu_table.verticalHeader().setVisible(False) 
-        self.gpu_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers) 
+        self.gpu_model = GPUStatsModel(_HEADERS, self)
+
+        self.gpu_table = QTableView()
+        self.gpu_table.setModel(self.gpu_model)
+        self._progress_delegate = ProgressBarDelegate(self.gpu_table)
+        self.gpu_table.setItemDelegateForColumn(UTIL_COLUMN, self._progress_delegate)
+        self.gpu_table.setItemDelegateForColumn(MEM_COLUMN, self._progress_delegate)
+        self._int_delegate = NumericDelegate(parent=self.gpu_table)
+        self._power_delegate = NumericDelegate(decimals=1, parent=self.gpu_table)
+        self.gpu_table.setItemDelegateForColumn(TEMP_COLUMN, self._int_delegate)
+        self.gpu_table.setItemDelegateForColumn(POWER_COLUMN, self._power_delegate)
+        self.gpu_table.setItemDelegateForColumn(FAN_COLUMN, self._int_delegate)
+        vertical_header = self.gpu_table.verticalHeader()
+        vertical_header.setVisible(False) 
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed) # Never query row sizeHints
+        vertical_header.setDefaultSectionSize(TABLE_ROW_HEIGHT) 
+        self.gpu_table.setShowGrid(False) 
+        self.gpu_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers) 
         self.gpu_table.setAlternatingRowColors(True)
         self.gpu_table.setFocusPolicy(Qt.FocusPolicy.NoFocus) 
-        self.gpu_table.setSelectionMode(QTableWidget.SelectionMode.NoSelection) 
+        self.gpu_table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection) 
         
         header = self.gpu_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents) 
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)          
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents) 
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)          
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)          
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents) 
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.ResizeToContents) 
+        for column, mode in enumerate(_RESIZE_MODES):
+            header.setSectionResizeMode(column, mode)
         
         main_layout.addWidget(self.gpu_table)
+        self._last_signature: tuple | None = None # Fingerprint of the last rendered stats
 
-        self.logger.info("MainWindow UI initialized.")
+        logger.info("MainWindow UI initialized.")
 
     def connect_phantom(self):
-        self.logger.info("Attempting to initiate Phantom connection via URI...")
+        logger.info("Attempting to initiate Phantom connection via URI...")
         
-        app_url = urllib.parse.quote("https://dantegpu.app") # Placeholder app URL
-        redirect_url = urllib.parse.quote("dantegpu://connection-success") # Placeholder redirect
-        # Construct the URI - Corrected parameter separation with '&'
-        phantom_uri = f"phantom://v1/connect?app_url={app_url}&redirect_link={redirect_url}"
+        phantom_uri = _PHANTOM_URI
+        logger.info("Opening URI: %s", phantom_uri)
         
-        self.logger.info(f"Opening URI: {phantom_uri}")
-        
-        try:
-            opened = webbrowser.open(phantom_uri)
-            if not opened:
-                 self.logger.warning("webbrowser.open() returned False. OS might not have handler for phantom://")
-                 # Consider showing a QMessageBox here to inform the user
-            else:
-                 self.logger.info("Phantom connection request initiated via browser/OS.")
-                 self.connect_wallet_button.setText("Request Sent...")
-                 self.connect_wallet_button.setEnabled(False)
-                 QTimer.singleShot(5000, lambda: (
-                      self.connect_wallet_button.setText("🔗 Connect Phantom"), 
-                      self.connect_wallet_button.setEnabled(True)
-                 ))
-        except Exception as e:
-            self.logger.error(f"Failed to open Phantom URI: {e}", exc_info=True)
-            # Consider showing a QMessageBox here
+        # webbrowser.open() blocks while the OS resolves the phantom:// handler; keep the GUI thread painting
+        task = _OpenUrlTask(phantom_uri)
+        task.signals.finished.connect(self._on_phantom_uri_opened)
+        self._open_url_task = task # Keep the signals object alive until the worker reports back
+        QThreadPool.globalInstance().start(task)
+
+    def _on_phantom_uri_opened(self, opened: bool):
+        if not opened:
+             logger.warning("webbrowser.open() returned False. OS might not have handler for phantom://")
+             # Consider showing a QMessageBox here to inform the user
+        else:
+             logger.info("Phantom connection request initiated via browser/OS.")
+             self.connect_wallet_button.setText("Request Sent...")
+             self.connect_wallet_button.setEnabled(False)
+             QTimer.singleShot(5000, lambda: (
+                  self.connect_wallet_button.setText("🔗 Connect Phantom"), 
+                  self.connect_wallet_button.setEnabled(True)
+             ))
             
     # Placeholder - actual connection logic is now in main.py's open_wallet_connect_page
     # def handle_connect_wallet_click(self):
     #      # This method is no longer needed here if connected from main.py
     #      pass
 
-    def update_stats(self, stats):
-        if not stats or 'gpus' not in stats:
+    def update_stats(self, stats: StatsPayload | None):
+        if stats is None:
             self.active_gpus_label.setText("Active GPUs: N/A")
             self.total_earnings_label.setText("Total Earnings: N/A")
-            self.gpu_table.setRowCount(0) 
-            self.logger.warning("Received invalid stats data.")
+            self.gpu_model.set_rows([])
+            self._last_signature = None
+            logger.warning("Received invalid stats data.")
             return
             
-        active_gpus = stats.get('active_gpus', 0)
-        total_earnings = stats.get('total_earnings', 0.0) 
-        self.active_gpus_label.setText(f"Active GPUs: {active_gpus}")
-        self.total_earnings_label.setText(f"Total Earnings: {total_earnings:.4f} SOL") 
-        
-        gpu_list = stats.get('gpus', [])
-        self.gpu_table.setRowCount(len(gpu_list))
-        
-        for row, gpu_data in enumerate(gpu_list):
-            gpu_id = gpu_data.get('id', 'N/A')
-            model = gpu_data.get('model', 'N/A') 
-            temp = gpu_data.get('temperature') 
-            util = gpu_data.get('utilization') 
-            mem_used = gpu_data.get('memory_used') 
-            mem_total = gpu_data.get('memory_total') 
-            power = gpu_data.get('power_usage') 
-            fan = gpu_data.get('fan_speed') 
-
-            id_item = QTableWidgetItem(str(gpu_id))
-            model_item = QTableWidgetItem(model) 
-            
-            temp_str = f"{temp}" if temp is not None else "N/A"
-            temp_item = QTableWidgetItem(temp_str)
-            temp_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            power_str = f"{power:.1f}" if power is not None else "N/A"
-            power_item = QTableWidgetItem(power_str)
-            power_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            fan_str = f"{fan}" if fan is not None else "N/A"
-            fan_item = QTableWidgetItem(fan_str)
-            fan_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            util_progress = TableProgressBar()
-            if util is not None:
-                util_progress.setRange(0, 100)
-                try:
-                     util_int = int(float(util)) # Handle potential float like CPU %
-                     util_progress.setValue(util_int)
-                except (ValueError, TypeError):
-                     self.logger.warning(f"Invalid utilization value for progress bar: {util}")
-                     util_progress.setRange(0,0) # Show N/A
-            else:
-                util_progress.setRange(0, 0) 
-                util_progress.setValue(0)
-
-            mem_progress = TableProgressBar()
-            if mem_used is not None and mem_total is not None and mem_total > 0:
-                mem_progress.setRange(0, 100)
-                try:
-                     mem_percent = int((mem_used / mem_total) * 100)
-                     mem_progress.setValue(mem_percent)
-                     mem_progress.text = lambda mu=mem_used, mt=mem_total: f"{format_bytes(mu)} / {format_bytes(mt)}"
-                except (ValueError, TypeError, ZeroDivisionError) as e:
-                     self.logger.warning(f"Invalid memory value for progress bar: used={mem_used}, total={mem_total}, error={e}")
-                     mem_progress.setRange(0,0) # Show N/A
-                     mem_progress.text = lambda: "Error"
-            else:
-                mem_progress.setRange(0, 0)
-                mem_progress.setValue(0)
-                mem_progress.text = lambda: "N/A"
-
-            self.gpu_table.setItem(row, 0, id_item)
-            self.gpu_table.setItem(row, 1, model_item) 
-            self.gpu_table.setItem(row, 2, temp_item)
-            self.gpu_table.setCellWidget(row, 3, util_progress) 
-            self.gpu_table.setCellWidget(row, 4, mem_progress) 
-            self.gpu_table.setItem(row, 5, power_item)
-            self.gpu_table.setItem(row, 6, fan_item)
-            
-        self.gpu_table.resizeRowsToContents() 
+        signature = (stats.active_gpus, round(stats.total_earnings, 4), tuple(map(_get_gpu_signature, stats.gpus)))
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
+
+        self.active_gpus_label.setText(_FMT_ACTIVE_GPUS(stats.active_gpus))
+        self.total_earnings_label.setText(_FMT_EARNINGS(stats.total_earnings)) 
+        self.gpu_model.set_rows(list(map(_build_row, stats.gpus)))
 
     def show_gpu_status_dialog(self):
-        self.logger.info("GPU Status dialog requested (not implemented yet).")
+        logger.info("GPU Status dialog requested (not implemented yet).")
         pass
         
     def show_settings_dialog(self):
-        self.logger.info("Settings dialog requested (not implemented yet).")
+        logger.info("Settings dialog requested (not implemented yet).")
         pass
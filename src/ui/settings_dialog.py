@@ -1,14 +1,15 @@
 import logging
 import platform 
+from dataclasses import replace
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QFormLayout, QComboBox, 
                              QCheckBox, QDialogButtonBox, QLabel, QWidget,
                              QMessageBox, QSpinBox, QLineEdit) # Import QLineEdit
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSignalBlocker
 
 try:
-    from ..utils.config import ConfigManager
+    from ..utils.config import ConfigManager, Settings
 except ImportError:
-    from utils.config import ConfigManager
+    from utils.config import ConfigManager, Settings
 
 IS_MACOS = platform.system() == "Darwin"
 if IS_MACOS:
@@ -30,14 +31,17 @@ else:
 
 
 class SettingsDialog(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, config: ConfigManager | None = None):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
-        self.config = ConfigManager() 
+        self.config = config if config is not None else ConfigManager() 
+        self._autostart_cached_state: bool | None = None # LaunchAgent state read by load_settings(); reread on each load
+        self._settings = Settings() # Snapshot the widgets were last loaded from
 
         self.setWindowTitle("Settings")
         self.setMinimumWidth(400)
 
+        self.setUpdatesEnabled(False) # Lay the form out once, after all rows are in
         main_layout = QVBoxLayout(self)
         form_layout = QFormLayout()
 
@@ -72,28 +76,31 @@ class SettingsDialog(QDialog):
 
         main_layout.addLayout(form_layout)
         main_layout.addWidget(button_box)
+        self.setUpdatesEnabled(True)
 
         self.load_settings()
         self.logger.debug("SettingsDialog initialized.")
 
     def load_settings(self):
+        # Programmatic loads shouldn't dispatch valueChanged/textChanged/etc.
+        blockers = [QSignalBlocker(w) for w in (self.log_level_combo, self.interval_spinbox, self.wallet_address_input, self.autostart_macos_check)]
         try:
-            current_log_level = self.config.get("log_level", "INFO").upper()
+            settings = self._settings = self.config.load_settings()
+            current_log_level = str(settings.log_level).upper()
             if current_log_level in self.log_levels:
                 self.log_level_combo.setCurrentText(current_log_level)
             else:
                  self.logger.warning(f"Invalid log_level '{current_log_level}' in config, defaulting to INFO.")
                  self.log_level_combo.setCurrentText("INFO")
             
-            current_interval = self.config.get("monitoring_interval", 5)
-            self.interval_spinbox.setValue(int(current_interval))
+            self.interval_spinbox.setValue(int(settings.monitoring_interval))
             
             # Load Wallet Address
-            current_wallet = self.config.get("wallet_address", "")
-            self.wallet_address_input.setText(current_wallet)
+            self.wallet_address_input.setText(settings.wallet_address)
 
             if AUTOSTART_SUPPORTED:
                 current_autostart_state = is_autostart_enabled() 
+                self._autostart_cached_state = current_autostart_state
                 self.autostart_macos_check.setChecked(current_autostart_state)
                 self.logger.debug(f"Loaded macOS autostart state: {current_autostart_state}")
             
@@ -101,29 +108,33 @@ class SettingsDialog(QDialog):
 
         except Exception as e:
             self.logger.error(f"Error loading settings into dialog: {e}")
+        finally:
+            for blocker in blockers:
+                blocker.unblock() # Explicit: don't rely on refcounting to destroy the blockers
 
 
     def save_settings(self) -> bool:
         config_save_success = False
         try:
-            new_log_level = self.log_level_combo.currentText()
-            new_interval = self.interval_spinbox.value()
-            new_wallet_address = self.wallet_address_input.text().strip() # Get text and strip whitespace
-            new_autostart_minimized_config = self.autostart_macos_check.isChecked() if AUTOSTART_SUPPORTED else False 
+            new_settings = replace(
+                self._settings,
+                log_level=self.log_level_combo.currentText(),
+                monitoring_interval=self.interval_spinbox.value(),
+                wallet_address=self.wallet_address_input.text().strip(), # Get text and strip whitespace
+                autostart_minimized=self.autostart_macos_check.isChecked() if AUTOSTART_SUPPORTED else False,
+            )
 
             # Optional: Add basic validation for Solana address format? 
             # For now, just save whatever user enters.
             # A simple check could be length, e.g., 32-44 chars, starts with specific chars?
-            # if new_wallet_address and not (32 <= len(new_wallet_address) <= 44):
+            # if new_settings.wallet_address and not (32 <= len(new_settings.wallet_address) <= 44):
             #     QMessageBox.warning(self, "Invalid Address", "Wallet address seems invalid. Please check.")
             #     return False # Prevent saving if validation fails
 
-            self.config.set("log_level", new_log_level)
-            self.config.set("monitoring_interval", new_interval)
-            self.config.set("wallet_address", new_wallet_address) # Save wallet address
-            self.config.set("autostart_minimized", new_autostart_minimized_config) 
+            self.config.save_settings(new_settings) # Writes only if a field changed
+            self._settings = new_settings
             
-            self.logger.info(f"Config settings saved: LogLevel={new_log_level}, Interval={new_interval}, Wallet={new_wallet_address}, AutostartMinimized={new_autostart_minimized_config}")
+            self.logger.info(f"Config settings saved: LogLevel={new_settings.log_level}, Interval={new_settings.monitoring_interval}, Wallet={new_settings.wallet_address}, AutostartMinimized={new_settings.autostart_minimized}")
             config_save_success = True
         except Exception as e:
             self.logger.error(f"Error saving config settings: {e}")
@@ -134,7 +145,9 @@ class SettingsDialog(QDialog):
         if AUTOSTART_SUPPORTED:
             autostart_action_success = False 
             should_be_enabled = self.autostart_macos_check.isChecked()
-            currently_enabled = is_autostart_enabled()
+            currently_enabled = self._autostart_cached_state
+            if currently_enabled is None:
+                 currently_enabled = is_autostart_enabled()
             
             operation_needed = should_be_enabled != currently_enabled
             operation_result = True 
@@ -152,6 +165,7 @@ class SettingsDialog(QDialog):
                          QMessageBox.critical(self, "Autostart Error", "Failed to disable autostart. Check logs and permissions for ~/Library/LaunchAgents.")
             
             if operation_result:
+                 self._autostart_cached_state = should_be_enabled
                  self.logger.info(f"macOS autostart state successfully set to: {should_be_enabled}")
                  autostart_action_success = True
             else:
@@ -1,8 +1,10 @@
 import sys
 import os
-import plistlib
 import logging
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
+from xml.sax.saxutils import escape as xml_escape
 
 APP_LABEL = "com.dantegpu.beatrice.login" 
 LAUNCH_AGENTS_DIR = Path.home() / "Library" / "LaunchAgents"
@@ -11,6 +13,32 @@ PLIST_PATH = LAUNCH_AGENTS_DIR / PLIST_FILENAME
 
 logger = logging.getLogger(__name__)
 
+# Only the paths vary between installs, so the plist is a fixed template; keys are in launchd's documented order
+_PLIST_TEMPLATE = b'''<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+	<key>Label</key>
+	<string>%(label)s</string>
+	<key>ProgramArguments</key>
+	<array>
+		<string>%(py)s</string>
+		<string>%(script)s</string>
+	</array>
+	<key>RunAtLoad</key>
+	<true/>
+	<key>WorkingDirectory</key>
+	<string>%(root)s</string>
+</dict>
+</plist>
+'''
+_PLIST_LABEL = xml_escape(APP_LABEL).encode()
+
+# Last known plist presence; only this module creates/removes the plist, so it stays valid once read
+_cached_state: Optional[bool] = None
+_launch_agents_verified = False # ~/Library/LaunchAgents known to exist; skip mkdir() after the first enable
+
+@lru_cache(maxsize=1) # Interpreter and script locations are fixed for the process; stat them once
 def _get_paths():
     python_executable = sys.executable 
     
@@ -41,6 +69,7 @@ def _get_paths():
 
 
 def enable_autostart() -> bool:
+    global _cached_state, _launch_agents_verified
     logger.info("Enabling autostart on login...")
     python_executable, main_script_path, project_root = _get_paths()
 
@@ -48,22 +77,25 @@ def enable_autostart() -> bool:
         logger.error("Could not determine necessary paths. Autostart NOT enabled.")
         return False
 
-    plist_data = {
-        "Label": APP_LABEL,
-        "ProgramArguments": [
-            python_executable,
-            main_script_path
-        ],
-        "RunAtLoad": True, 
-        "WorkingDirectory": project_root, 
+    payload = _PLIST_TEMPLATE % {
+        b"label": _PLIST_LABEL,
+        b"py": xml_escape(python_executable).encode(),
+        b"script": xml_escape(main_script_path).encode(),
+        b"root": xml_escape(project_root).encode(),
     }
 
     try:
-        LAUNCH_AGENTS_DIR.mkdir(parents=True, exist_ok=True)
+        if not _launch_agents_verified:
+            LAUNCH_AGENTS_DIR.mkdir(parents=True, exist_ok=True)
+            _launch_agents_verified = True
         
-        with open(PLIST_PATH, 'wb') as fp:
-            plistlib.dump(plist_data, fp)
+        fd = os.open(PLIST_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
             
+        _cached_state = True
         logger.info(f"Autostart enabled. Plist file created at: {PLIST_PATH}")
         return True
     except Exception as e:
@@ -71,18 +103,19 @@ def enable_autostart() -> bool:
         return False
 
 def disable_autostart() -> bool:
+    global _cached_state
     logger.info("Disabling autostart on login...")
     try:
-        if PLIST_PATH.exists():
-            PLIST_PATH.unlink()
-            logger.info(f"Autostart disabled. Plist file removed: {PLIST_PATH}")
-            return True
-        else:
-            logger.info("Autostart plist file does not exist. Nothing to disable.")
-            return True 
-    except Exception as e:
+        PLIST_PATH.unlink(missing_ok=True) # One syscall, no exists()/unlink() race
+        _cached_state = False
+        logger.info(f"Autostart disabled. Plist file removed if present: {PLIST_PATH}")
+        return True
+    except OSError as e:
         logger.error(f"Failed to remove plist file for autostart: {e}")
         return False
 
 def is_autostart_enabled() -> bool:
-    return PLIST_PATH.exists()
+    global _cached_state
+    if _cached_state is None:
+        _cached_state = PLIST_PATH.exists()
+    return _cached_state
@@ -1,17 +1,68 @@
-import json
+import atexit
 import os
 import logging # Import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    JSONDecodeError = orjson.JSONDecodeError
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2) # Keys keep their insertion order
+    _loads = orjson.loads
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+    JSONDecodeError = json.JSONDecodeError
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8") # Byte-identical to the orjson path
+    _loads = json.loads
+
 logger = logging.getLogger(__name__) # Setup logger for this module
 
+CONFIG_WRITE_BUFFER = 64 * 1024 # Whole config goes out in a single write()
+CONFIG_SAVE_DEBOUNCE = 0.025 # Seconds; a burst of set() calls within this window costs one write
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """User-editable settings, read and written as one snapshot by the settings dialog."""
+    log_level: str = "INFO"
+    monitoring_interval: int = 5
+    wallet_address: str = ""
+    autostart_minimized: bool = False
+
+_SETTINGS_KEYS = tuple(f.name for f in fields(Settings))
+_SETTINGS_DEFAULTS = asdict(Settings())
+
 class ConfigManager:
+    """Process-wide config store; every ConfigManager() returns the same, already-loaded instance."""
+    _instance: Optional["ConfigManager"] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
     def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
         self.config_dir = Path.home() / ".dantegpu"
         self.config_file = self.config_dir / "config.json"
         self.config: Dict[str, Any] = {}
+        self._batch_depth = 0 # >0 while inside batch(); set() then defers the write
+        self._dirty = False
+        self._last_serialized: Optional[bytes] = None # JSON last loaded from / written to disk
+        self._flush_timer: Optional[threading.Timer] = None # Pending debounced save from set()
+        self._pending_snapshot: Optional[Dict[str, Any]] = None # Copy of config the timer thread will write
+        self._flush_lock = threading.Lock() # Guards the timer/snapshot pair and serializes writes
         self._load_config()
+        atexit.register(self.flush)
         
     def _load_config(self):
         try:
@@ -21,13 +72,13 @@ class ConfigManager:
                 
             if self.config_file.exists():
                 logger.info(f"Loading config from: {self.config_file}")
-                with open(self.config_file, "r") as f:
-                    self.config = json.load(f)
+                self.config = _loads(self.config_file.read_bytes())
+                self._last_serialized = _dumps(self.config)
             else:
                 logger.info("Config file not found, creating default config.")
                 self._create_default_config()
                 
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
              logger.error(f"Error decoding config file {self.config_file}: {e}. Creating default config.")
              self._create_default_config()
         except Exception as e:
@@ -37,9 +88,11 @@ class ConfigManager:
     def _create_default_config(self):
         self.config = {
             "log_level": "INFO", 
+            "file_logging": True, # Also write ~/.dantegpu/logs/dantegpu.log
             "monitoring_interval": 5, 
             "autostart_minimized": False,
             "wallet_address": "", # Add default empty wallet address
+            "nvml_enable_persistence_mode": False, # Try 'nvidia-smi -pm 1' equivalent at startup if NVML is slow (needs root)
             "marketplace_url": "https://api.example.dantegpu.market", 
             "gpu_settings": {
                 "power_limit": 100,
@@ -50,17 +103,96 @@ class ConfigManager:
         logger.info("Saving default configuration.")
         self._save_config()
         
-    def _save_config(self):
+    def _save_config(self, fsync: bool = False, data: Optional[Dict[str, Any]] = None):
+        tmp_file = self.config_file.with_suffix(".json.tmp")
         try:
-            with open(self.config_file, "w") as f:
-                json.dump(self.config, f, indent=4)
+            payload = _dumps(self.config if data is None else data)
+            if payload == self._last_serialized:
+                logger.debug("Configuration unchanged; skipping write.")
+                return
+            # Write a sibling temp file and swap it in, so a crash mid-write never leaves a truncated config
+            with open(tmp_file, "wb", buffering=CONFIG_WRITE_BUFFER) as f:
+                f.write(payload)
+                f.flush()
+                if fsync:
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
+            self._last_serialized = payload
             logger.debug(f"Configuration saved to {self.config_file}")
         except Exception as e:
             logger.error(f"Error saving config to {self.config_file}: {e}")
+            try:
+                tmp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
             
     def get(self, key: str, default: Any = None) -> Any:
         return self.config.get(key, default)
         
     def set(self, key: str, value: Any):
+        if key in self.config and self.config[key] == value:
+            return
         self.config[key] = value
-        self._save_config()
+        if self._batch_depth:
+            self._dirty = True
+            return
+        with self._flush_lock:
+            # The timer thread serializes this copy, never the dict the caller keeps mutating
+            self._pending_snapshot = dict(self.config)
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(CONFIG_SAVE_DEBOUNCE, self._flush_pending)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def update(self, values: Dict[str, Any]):
+        """Set several keys with a single write to disk."""
+        self.config.update(values)
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self.flush()
+
+    def flush(self):
+        """Write any pending set() changes now instead of waiting for the debounce timer.
+
+        Call from the thread that mutates the config (the GUI thread), as update(), batch() and atexit do.
+        """
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._pending_snapshot = None
+            self._save_config()
+
+    def _flush_pending(self):
+        # Runs on the debounce timer thread
+        with self._flush_lock:
+            snapshot, self._pending_snapshot = self._pending_snapshot, None
+            if snapshot is not None:
+                self._save_config(data=snapshot)
+
+    set_many = update
+
+    def load_settings(self) -> Settings:
+        config = self.config
+        return Settings(*(config.get(key, _SETTINGS_DEFAULTS[key]) for key in _SETTINGS_KEYS))
+
+    def save_settings(self, settings: Settings):
+        """Persist the fields of settings that differ from the current config; no write if none do."""
+        config = self.config
+        changed = {key: value for key, value in asdict(settings).items() if key not in config or config[key] != value}
+        if changed:
+            self.update(changed)
+
+    @contextmanager
+    def batch(self):
+        """Defer writes from set()/update() inside the block to one save on exit."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._dirty = False
+                self.flush()
@@ -1,13 +1,25 @@
+import math
+from functools import lru_cache
+
+_KIB, _MIB, _GIB = 1 << 10, 1 << 20, 1 << 30
+# (reciprocal of divisor, suffix), indexed by (bit_length - 1) // 10, clamped to GiB
+_BYTE_UNITS = ((1.0, "B"), (1 / _KIB, "KiB"), (1 / _MIB, "MiB"), (1 / _GIB, "GiB"))
+_NUMBER_TYPES = (int, float)
+_MAX_UNIT = len(_BYTE_UNITS) - 1
+
+@lru_cache(maxsize=2048, typed=True) # typed: 5 and 5.0 format differently ("5 B" vs "5.0 B")
+def _format_bytes_cached(bytes_val):
+    idx = min(max(0, (int(bytes_val).bit_length() - 1) // 10), _MAX_UNIT)
+    if not idx:
+        return f"{bytes_val} B"
+    scale, suffix = _BYTE_UNITS[idx]
+    return f"{bytes_val*scale:.1f} {suffix}"
+
 def format_bytes(bytes_val):
     if bytes_val is None:
         return "N/A"
-    if not isinstance(bytes_val, (int, float)) or bytes_val < 0:
+    if not isinstance(bytes_val, _NUMBER_TYPES) or isinstance(bytes_val, bool) or bytes_val < 0:
         return "Invalid" 
-    if bytes_val < 1024:
-        return f"{bytes_val} B"
-    elif bytes_val < 1024**2:
-        return f"{bytes_val/1024:.1f} KiB"
-    elif bytes_val < 1024**3:
-        return f"{bytes_val/1024**2:.1f} MiB"
-    else:
-        return f"{bytes_val/1024**3:.1f} GiB"
+    if isinstance(bytes_val, float) and not math.isfinite(bytes_val): # nan/inf have no bit_length() to pick a unit from
+        return "Invalid"
+    return _format_bytes_cached(bytes_val)
@@ -1,56 +1,158 @@
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-import coloredlogs
+from typing import Optional
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
 try:
     from .config import ConfigManager
 except ImportError:
     from utils.config import ConfigManager # Fallback
 
-def setup_logger(name: str = None) -> logging.Logger:
-    config = ConfigManager()
-    log_level_str = config.get("log_level", "INFO").upper()
-    log_level = getattr(logging, log_level_str, logging.INFO)
+LOG_DIR = Path.home() / ".dantegpu" / "logs"
+LOG_FILE_BUFFER = 64 * 1024
+_log_dir_created = False # mkdir() once per process, not per configured logger
 
-    logger = logging.getLogger(name or "DanteGPU")
-    
-    # Check if handlers already exist to prevent duplication
-    if logger.hasHandlers():
-        logger.handlers.clear()
-        
-    logger.setLevel(log_level) 
-    logger.propagate = False 
+class _BufferedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler with a 64 KiB write buffer.
+
+    Records are not flushed one by one; WARNING+ records flush at once, and _IdleFlushQueueListener
+    flushes whenever its queue drains, so at most the current burst is ever held in memory.
+    """
+    _size = 0
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=LOG_FILE_BUFFER, encoding=self.encoding, errors=self.errors)
+        self._size = stream.seek(0, 2)
+        return stream
+
+    def emit(self, record):
+        # Same steps as RotatingFileHandler.emit(), minus StreamHandler's per-record flush() and the
+        # base shouldRollover()'s seek to EOF (which also flushes); the size is tracked here instead
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._size + len(msg) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += len(msg)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+class _IdleFlushQueueListener(QueueListener):
+    """QueueListener that flushes its handlers each time the queue runs empty."""
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            if not block:
+                raise
+        for handler in self.handlers:
+            handler.flush()
+        return self.queue.get()
+
+# The single log file handler behind the root logger's queue; stop_log_listeners() flushes it
+_file_handler: Optional[_BufferedRotatingFileHandler] = None
+
+# Root carries a single QueueHandler; the real console/file handlers run on the one listener thread behind it
+_log_queue_handler: Optional[QueueHandler] = None
+_log_listener: Optional[QueueListener] = None
+
+_log_level: Optional[int] = None # Resolved from config on the first setup_logger() call
+
+def _configured_log_level() -> int:
+    global _log_level
+    if _log_level is None:
+        log_level_str = ConfigManager().get("log_level", "INFO").upper()
+        _log_level = getattr(logging, log_level_str, logging.INFO)
+    return _log_level
+
+def _configure_root_logger():
+    global _log_dir_created, _file_handler, _log_queue_handler, _log_listener
+    root = logging.getLogger()
+    log_level = _configured_log_level()
+    if root.hasHandlers():
+        root.handlers.clear()
 
     log_format = '%(asctime)s - %(name)s:%(lineno)d - %(levelname)s - %(message)s'
     
     # Use coloredlogs for console output
+    import coloredlogs # Deferred: pulls in humanfriendly and friends; only needed once logging is configured
     coloredlogs.install(
         level=log_level, 
-        logger=logger,
+        logger=root,
         fmt=log_format,
         level_styles=coloredlogs.DEFAULT_LEVEL_STYLES,
         field_styles=coloredlogs.DEFAULT_FIELD_STYLES
     )
 
-    # Setup file logging
-    try:
-        log_dir = Path.home() / ".dantegpu" / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = RotatingFileHandler(
-            log_dir / "dantegpu.log",
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5,
-            encoding='utf-8' # Specify encoding
-        )
-        file_formatter = logging.Formatter(log_format) # Use the same format
-        file_handler.setFormatter(file_formatter)
-        file_handler.setLevel(log_level) # Set level for file handler too
-        logger.addHandler(file_handler)
-    except Exception as e:
-         # Log error using the console handler already set up by coloredlogs
-         logger.error(f"Failed to set up file logging: {e}", exc_info=True)
-
-    return logger
+    # Setup file logging (on by default; "file_logging": false in config.json skips the file entirely)
+    if ConfigManager().get("file_logging", True):
+        try:
+            if not _log_dir_created:
+                LOG_DIR.mkdir(parents=True, exist_ok=True)
+                _log_dir_created = True
+            
+            _file_handler = _BufferedRotatingFileHandler(
+                LOG_DIR / "dantegpu.log",
+                maxBytes=10*1024*1024,  # 10MB
+                backupCount=5,
+                encoding='utf-8', # Specify encoding
+                delay=True # Open on the first record, from the listener thread
+            )
+            file_formatter = logging.Formatter(log_format) # Use the same format
+            _file_handler.setFormatter(file_formatter)
+            root.addHandler(_file_handler)
+        except Exception as e:
+             # Log error using the console handler already set up by coloredlogs
+             root.error(f"Failed to set up file logging: {e}", exc_info=True)
+
+    # Move the console/file handlers behind a queue so callers (e.g. the Qt GUI thread) never block on log I/O.
+    # Levels are enforced once, by root and its QueueHandler (see set_log_level); the sinks take whatever arrives.
+    sink_handlers = list(root.handlers)
+    root.handlers.clear()
+    for handler in sink_handlers:
+        handler.setLevel(logging.NOTSET)
+    _log_queue_handler = QueueHandler(queue.SimpleQueue())
+    root.addHandler(_log_queue_handler)
+    set_log_level(log_level)
+    _log_listener = _IdleFlushQueueListener(_log_queue_handler.queue, *sink_handlers)
+    _log_listener.start()
+
+def setup_logger(name: str = None) -> logging.Logger:
+    """Return the named logger; the first call configures the root logger's queue, console and file output."""
+    if _log_listener is None:
+        _configure_root_logger()
+    return logging.getLogger(name or "DanteGPU") # Propagates to root; level NOTSET, so set_log_level() governs it
+
+def set_log_level(level: int):
+    """Apply a log level to the root logger and the QueueHandler in front of the console/file sinks."""
+    global _log_level
+    _log_level = level
+    logging.getLogger().setLevel(level)
+    if _log_queue_handler is not None:
+        _log_queue_handler.setLevel(level)
+
+def stop_log_listeners():
+    """Flush queued records and stop the listener thread started by setup_logger."""
+    global _log_listener
+    if _log_listener is None:
+        return
+    listener, _log_listener = _log_listener, None
+    listener.stop()
+    # Anything logged during interpreter shutdown goes straight to the sinks instead of a dead queue
+    root = logging.getLogger()
+    root.removeHandler(_log_queue_handler)
+    for handler in listener.handlers:
+        root.addHandler(handler)
+    if _file_handler is not None:
+        _file_handler.flush()
@@ -1,15 +1,28 @@
 import asyncio
+import json
 import logging
-import queue
-from typing import Optional
+from typing import Callable, Optional
 from aiohttp import web
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _loads = orjson.loads # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    _dumps = orjson.dumps
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _loads = json.loads
+    def _dumps(data) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
 logger = logging.getLogger(__name__)
 
-# Shared queue to send the connected wallet address back to the main thread
-# This should be the same queue instance used by the main application
-wallet_update_queue: Optional[queue.Queue] = None
+_SUCCESS_BODY = _dumps({"status": "success", "message": "Address received"}) # Constant; serialize once
+
+# Callback that hands the connected wallet address back to the main application.
+# It is invoked from the web server thread, so it must be thread-safe (e.g. a Qt signal's emit).
+wallet_update_callback: Optional[Callable[[str], None]] = None
 
 # Path to the HTML file
 HTML_FILE_PATH = Path(__file__).parent / "connect.html"
@@ -30,7 +43,7 @@ async def handle_callback(request: web.Request) -> web.Response:
         return web.Response(text="Method Not Allowed", status=405)
         
     try:
-        data = await request.json()
+        data = await request.json(loads=_loads)
         wallet_address = data.get("walletAddress")
         
         if not wallet_address:
@@ -39,20 +52,16 @@ async def handle_callback(request: web.Request) -> web.Response:
 
         logger.info(f"Received wallet address via callback: {wallet_address}")
         
-        if wallet_update_queue:
+        if wallet_update_callback:
             try:
-                # Send address back to the main thread via the queue
-                wallet_update_queue.put_nowait({"type": "wallet_update", "address": wallet_address})
-                logger.info("Wallet address placed in update queue.")
-                return web.json_response({"status": "success", "message": "Address received"})
-            except queue.Full:
-                logger.error("Wallet update queue is full. Cannot send address.")
-                return web.json_response({"status": "error", "message": "Queue full"}, status=500)
-            except Exception as qe:
-                 logger.error(f"Error putting wallet address into queue: {qe}")
+                wallet_update_callback(wallet_address)
+                logger.info("Wallet address handed to update callback.")
+                return web.Response(body=_SUCCESS_BODY, content_type='application/json')
+            except Exception as ce:
+                 logger.error(f"Error delivering wallet address to callback: {ce}")
                  return web.json_response({"status": "error", "message": "Internal server error"}, status=500)
         else:
-            logger.error("Wallet update queue is not set in local_server.")
+            logger.error("Wallet update callback is not set in local_server.")
             return web.json_response({"status": "error", "message": "Server configuration error"}, status=500)
 
     except json.JSONDecodeError:
@@ -62,14 +71,15 @@ async def handle_callback(request: web.Request) -> web.Response:
         logger.error(f"Error handling callback: {e}", exc_info=True)
         return web.json_response({"status": "error", "message": "Internal server error"}, status=500)
 
-async def start_local_server(host='127.0.0.1', port=51345, update_queue: queue.Queue = None):
-    """Starts the aiohttp web server."""
-    global wallet_update_queue
-    if update_queue is None:
-         logger.error("Update queue must be provided to start_local_server.")
-         raise ValueError("Update queue is required.")
+async def start_local_server(host='127.0.0.1', port=51345, update_callback: Callable[[str], None] = None,
+                             stop_event: Optional[asyncio.Event] = None):
+    """Starts the aiohttp web server and serves until `stop_event` is set."""
+    global wallet_update_callback
+    if update_callback is None:
+         logger.error("Update callback must be provided to start_local_server.")
+         raise ValueError("Update callback is required.")
          
-    wallet_update_queue = update_queue
+    wallet_update_callback = update_callback
     
     app = web.Application()
     app.router.add_get('/connect', handle_connect)
@@ -82,9 +92,8 @@ async def start_local_server(host='127.0.0.1', port=51345, update_queue: queue.Q
     try:
         await site.start()
         logger.info(f"Local web server started at http://{host}:{port}")
-        # Keep server running until stopped externally (e.g., by cancelling the task)
-        # We need a way to signal shutdown, asyncio.Event is good for this
-        shutdown_event = asyncio.Event()
+        # Keep server running until the caller sets stop_event (or stop_local_server() is called)
+        shutdown_event = stop_event if stop_event is not None else asyncio.Event()
         # Store the event so it can be set from outside
         app['shutdown_event'] = shutdown_event 
         await shutdown_event.wait() 
@@ -110,8 +119,7 @@ async def stop_local_server(app: web.Application):
 
 # Example of how to run this server (would typically be run in a thread from main.py)
 # async def main():
-#     q = queue.Queue()
-#     server_task = asyncio.create_task(start_local_server(port=51345, update_queue=q))
+#     server_task = asyncio.create_task(start_local_server(port=51345, update_callback=print))
 #     # Keep it running for a bit or until stopped
 #     await asyncio.sleep(60) 
 #     # Get the app instance to signal stop (this is tricky across threads)